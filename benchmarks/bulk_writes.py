@@ -0,0 +1,135 @@
+"""
+Measures how fast `EnumChoiceField` values are prepared when writing rows
+with `bulk_create` and `bulk_update`.
+
+Compares:
+
+* `get_prep_value` - preparing the way it was done before the precomputed table:
+  `get_db_prep_value` -> `get_prep_value` -> `get_choice_value` for every object
+* `db prep table` - `get_db_prep_value`, which resolves enumerations
+  with a single dictionary lookup
+
+`bulk_update_enum` from `EnumChoiceQuerySet` is measured next to `bulk_update`.
+
+Besides `bulk_create` and `bulk_update`, the time spent only on preparing
+the values is measured, by calling `get_db_prep_save` for every value
+and `get_prep_values` once for all of them.
+
+Usage:
+
+    python benchmarks/bulk_writes.py [--rows 100000] [--members 5]
+"""
+import argparse
+import os
+import sys
+import time
+from enum import Enum
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import django  # noqa: E402
+from django.conf import settings  # noqa: E402
+
+settings.configure(
+    DATABASES={
+        'default': {
+            'ENGINE': 'django.db.backends.sqlite3',
+            'NAME': ':memory:'
+        }
+    },
+    INSTALLED_APPS=[]
+)
+django.setup()
+
+from django.db import connection, models  # noqa: E402
+from django.db.models import Field  # noqa: E402
+
+from django_enum_choices.fields import EnumChoiceField  # noqa: E402
+from django_enum_choices.query import EnumChoiceManager  # noqa: E402
+
+
+class GetPrepValueEnumChoiceField(EnumChoiceField):
+    def get_db_prep_value(self, value, connection, prepared=False):
+        return Field.get_db_prep_value(self, value, connection, prepared)
+
+
+def build_model(name, field):
+    attrs = {
+        '__module__': __name__,
+        'Meta': type('Meta', (), {'app_label': 'benchmarks'}),
+        'enumeration': field,
+        'objects': EnumChoiceManager(),
+    }
+
+    return type(name, (models.Model, ), attrs)
+
+
+def measure(function, rows):
+    started = time.perf_counter()
+    function()
+    elapsed = time.perf_counter() - started
+
+    return rows / elapsed
+
+
+def run(rows, members):
+    enum_class = Enum('BenchmarkEnum', [('MEMBER_{}'.format(i), 'value_{}'.format(i)) for i in range(members)])
+    all_members = list(enum_class)
+
+    benchmark_models = [
+        ('get_prep_value', build_model('GetPrepValueModel', GetPrepValueEnumChoiceField(enum_class))),
+        ('db prep table', build_model('DbPrepTableModel', EnumChoiceField(enum_class))),
+    ]
+
+    with connection.schema_editor() as schema_editor:
+        for _, model in benchmark_models:
+            schema_editor.create_model(model)
+
+    print('{} rows, {} members'.format(rows, members))
+
+    values = [all_members[i % members] for i in range(rows)]
+
+    for name, model in benchmark_models:
+        field = model._meta.get_field('enumeration')
+        prepared = measure(lambda: [field.get_db_prep_save(value, connection) for value in values], rows)
+
+        print('{:>15}: get_db_prep_save {:>12,.0f} values/sec'.format(name, prepared))
+
+    field = benchmark_models[-1][1]._meta.get_field('enumeration')
+    prepared = measure(lambda: field.get_prep_values(values), rows)
+
+    print('{:>15}: get_prep_values {:>13,.0f} values/sec'.format('batched', prepared))
+
+    for name, model in benchmark_models:
+        instances = [model(enumeration=all_members[i % members]) for i in range(rows)]
+
+        created = measure(lambda: model.objects.bulk_create(instances, batch_size=500), rows)
+
+        instances = list(model.objects.all())
+
+        for i, instance in enumerate(instances):
+            instance.enumeration = all_members[(i + 1) % members]
+
+        updated = measure(lambda: model.objects.bulk_update(instances, ['enumeration'], batch_size=500), rows)
+
+        values_by_pk = {
+            instance.pk: all_members[(i + 2) % members]
+            for i, instance in enumerate(instances)
+        }
+
+        updated_by_enum = measure(lambda: model.objects.bulk_update_enum('enumeration', values_by_pk), rows)
+
+        print(
+            '{:>15}: bulk_create {:>10,.0f} rows/sec, bulk_update {:>10,.0f} rows/sec, '
+            'bulk_update_enum {:>10,.0f} rows/sec'.format(name, created, updated, updated_by_enum)
+        )
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=100000)
+    parser.add_argument('--members', type=int, default=5)
+
+    arguments = parser.parse_args()
+
+    run(arguments.rows, arguments.members)
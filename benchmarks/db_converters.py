@@ -0,0 +1,128 @@
+"""
+Measures how fast `EnumChoiceField` columns are decoded when reading rows.
+
+Compares:
+
+* `linear scan` - decoding the way it was done before the shared registry:
+  `from_db_value` -> `to_enum_value`, which rebuilds the choice of every
+  enumeration until it finds a match
+* `from_db_value` - `from_db_value` -> `to_enum_value` backed by the registry,
+  the way it was done before the precompiled converter
+* `db converter` - the converter, returned from `EnumChoiceField.get_db_converters`
+
+The first two variants override `from_db_value`, because `EnumChoiceField.from_db_value`
+delegates to the precompiled converter.
+
+Usage:
+
+    python benchmarks/db_converters.py [--rows 100000] [--members 200]
+"""
+import argparse
+import os
+import sys
+import time
+from enum import Enum
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import django  # noqa: E402
+from django.conf import settings  # noqa: E402
+
+settings.configure(
+    DATABASES={
+        'default': {
+            'ENGINE': 'django.db.backends.sqlite3',
+            'NAME': ':memory:'
+        }
+    },
+    INSTALLED_APPS=[]
+)
+django.setup()
+
+from django.db import connection, models  # noqa: E402
+from django.core.exceptions import ValidationError  # noqa: E402
+
+from django_enum_choices.fields import EnumChoiceField  # noqa: E402
+from django_enum_choices.utils import value_from_built_choice  # noqa: E402
+
+
+class LinearScanEnumChoiceField(EnumChoiceField):
+    def get_db_converters(self, connection):
+        return [self.from_db_value]
+
+    def from_db_value(self, value, expression, connection, *args):
+        return self.to_enum_value(value)
+
+    def to_enum_value(self, value):
+        if value is None:
+            return
+
+        for choice in self.enum_class:
+            if value_from_built_choice(self.choice_builder(choice)) == value:
+                return choice
+
+        raise ValidationError('Value {} not found in {}'.format(value, self.enum_class))
+
+
+class FromDbValueEnumChoiceField(EnumChoiceField):
+    def get_db_converters(self, connection):
+        return [self.from_db_value]
+
+    def from_db_value(self, value, expression, connection, *args):
+        return self.to_enum_value(value)
+
+
+def build_models(enum_class):
+    attrs = {
+        '__module__': __name__,
+        'Meta': type('Meta', (), {'app_label': 'benchmarks'}),
+        'linear_scan': LinearScanEnumChoiceField(enum_class),
+        'from_db_value': FromDbValueEnumChoiceField(enum_class),
+        'db_converter': EnumChoiceField(enum_class),
+    }
+
+    return type('BenchmarkModel', (models.Model, ), attrs)
+
+
+def run(rows, members):
+    enum_class = Enum('BenchmarkEnum', [('MEMBER_{}'.format(i), 'value_{}'.format(i)) for i in range(members)])
+    model = build_models(enum_class)
+
+    with connection.schema_editor() as schema_editor:
+        schema_editor.create_model(model)
+
+    all_members = list(enum_class)
+    model.objects.bulk_create(
+        [
+            model(
+                linear_scan=all_members[i % members],
+                from_db_value=all_members[i % members],
+                db_converter=all_members[i % members]
+            )
+            for i in range(rows)
+        ],
+        batch_size=500
+    )
+
+    print('{} rows, {} members'.format(rows, members))
+
+    for field_name in ('linear_scan', 'from_db_value', 'db_converter'):
+        queryset = model.objects.values_list(field_name, flat=True)
+
+        started = time.perf_counter()
+        decoded = list(queryset)
+        elapsed = time.perf_counter() - started
+
+        assert len(decoded) == rows
+
+        print('{:>15}: {:>12,.0f} rows/sec'.format(field_name.replace('_', ' '), rows / elapsed))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=100000)
+    parser.add_argument('--members', type=int, default=200)
+
+    arguments = parser.parse_args()
+
+    run(arguments.rows, arguments.members)
@@ -0,0 +1,70 @@
+"""
+Measures how fast `EnumChoiceField` instances are constructed,
+which happens for every field when models are imported and repeatedly
+when migrations render `ProjectState`.
+
+Compares:
+
+* `rebuilt choices` - constructing the way it was done before the registry cached
+  the built choices: building, validating and measuring the choices on every `__init__`
+* `cached choices` - `EnumChoiceField`, which gets them from the shared registry
+
+Usage:
+
+    python benchmarks/field_construction.py [--fields 1000] [--members 3000]
+"""
+import argparse
+import os
+import sys
+import time
+from enum import Enum
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import django  # noqa: E402
+from django.conf import settings  # noqa: E402
+
+settings.configure(INSTALLED_APPS=[])
+django.setup()
+
+from django_enum_choices.fields import EnumChoiceField  # noqa: E402
+from django_enum_choices.utils import build_enum_choices  # noqa: E402
+
+
+class RebuiltChoicesEnumChoiceField(EnumChoiceField):
+    def build_choices(self):
+        self.rebuilt_choices = build_enum_choices(self.enum_class, self.choice_builder)
+
+        return self.rebuilt_choices
+
+    def _calculate_max_length(self):
+        return max(len(choice) for choice, _ in self.rebuilt_choices)
+
+
+def run(fields, members):
+    enum_class = Enum('BenchmarkEnum', [('MEMBER_{}'.format(i), 'value_{}'.format(i)) for i in range(members)])
+
+    print('{} fields, {} members'.format(fields, members))
+
+    for name, field_class in (
+        ('rebuilt choices', RebuiltChoicesEnumChoiceField),
+        ('cached choices', EnumChoiceField),
+    ):
+        started = time.perf_counter()
+
+        for _ in range(fields):
+            field_class(enum_class)
+
+        elapsed = time.perf_counter() - started
+
+        print('{:>15}: {:>10,.0f} fields/sec'.format(name, fields / elapsed))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--fields', type=int, default=1000)
+    parser.add_argument('--members', type=int, default=3000)
+
+    arguments = parser.parse_args()
+
+    run(arguments.fields, arguments.members)
@@ -25,7 +25,7 @@ class EnumChoiceListFilter(admin.ChoicesFieldListFilter):
         }
         none_title = ''
         for lookup, title in self.field.flatchoices:
-            lookup = self.field.get_prep_value(lookup)
+            lookup = self.field.get_choice_value(lookup)
 
             if lookup is None:
                 none_title = title
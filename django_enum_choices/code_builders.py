@@ -0,0 +1,5 @@
+from enum import Enum
+
+
+def value_code(enumeration: Enum) -> int:
+    return enumeration.value
@@ -1,23 +1,113 @@
+import json
 from enum import Enum
-from typing import Tuple, Type
+from functools import partialmethod
+from typing import Any, Dict, List, Tuple, Type
 
-from django.db.models import CharField
+from django.db.models import BigIntegerField, CharField, Field
 from django.core.exceptions import ValidationError
 from django.core.validators import MaxLengthValidator
 from django.utils.translation import gettext as _
 from django.utils.text import capfirst
+from django.utils.encoding import force_str
+from django.utils.functional import cached_property
 
 from .exceptions import EnumChoiceFieldException
 from .validators import EnumValueMaxLengthValidator
 from .choice_builders import value_value
 from .utils import as_choice_builder, value_from_built_choice, build_enum_choices
-from .forms import EnumChoiceField as EnumChoiceFormField
+from .registry import get_enum_choice_map
+from .max_length_policies import ExactMaxLength
+from .forms import (
+    EnumChoiceField as EnumChoiceFormField,
+    MultipleEnumChoiceField as MultipleEnumChoiceFormField
+)
+from .lookups import EnumChoiceExact, EnumChoiceIn, RawEnumValue, HasAny, HasAll, HasNone
+
+# The range of `SmallIntegerField`, which is safe for all database backends
+SMALL_INTEGER_MIN = -32768
+SMALL_INTEGER_MAX = 32767
+
+# `BigIntegerField` is signed, so the last bit is left out
+MAX_ENUM_SET_BITS = 63
+
+
+def _get_enum_choice_display(instance, field):
+    """
+    `get_<field>_display` for `EnumChoiceField`, which looks up the label
+    of the enumeration in the shared choice map instead of building
+    a dictionary from `flatchoices` on every call.
+    """
+
+    value = getattr(instance, field.attname)
+
+    try:
+        label = field.choice_map.label_by_member.get(value, value)
+    except TypeError:
+        label = value
+
+    return force_str(label, strings_only=True)
+
+
+class LazyEnumChoiceDescriptor:
+    """
+    Installed on the model by `EnumChoiceField(lazy=True)`.
+
+    Rows are loaded with the values, stored in the database,
+    which are decoded to enumerations on first access and cached on the instance.
+    Values that are not stored values of the field are returned as they are.
+    """
+
+    def __init__(self, field):
+        self.field = field
+
+    def __get__(self, instance, cls=None):
+        if instance is None:
+            return self
+
+        attname = self.field.attname
+
+        if attname not in instance.__dict__:
+            # The field is deferred
+            instance.refresh_from_db(fields=[attname])
+
+        value = instance.__dict__[attname]
+
+        if value is None or isinstance(value, self.field.enum_class):
+            return value
+
+        try:
+            member = self.field.member_by_db_value.get(value)
+        except TypeError:
+            member = None
+
+        if member is None:
+            return value
+
+        instance.__dict__[attname] = member
+
+        return member
+
+    def __set__(self, instance, value):
+        instance.__dict__[self.field.attname] = value
 
 
 class EnumChoiceField(CharField):
     description = _('EnumChoiceField for %(enum_class)')
 
-    def __init__(self, enum_class: Type[Enum], choice_builder=value_value, **kwargs):
+    def __init__(
+        self,
+        enum_class: Type[Enum],
+        choice_builder=value_value,
+        codes=None,
+        postgres_enum_type=None,
+        db_check_constraint=False,
+        lazy=False,
+        inline_choices=True,
+        legacy_values=None,
+        max_length_policy=None,
+        check_values=None,
+        **kwargs
+    ):
         if not issubclass(enum_class, Enum):
             raise EnumChoiceFieldException(
                 _('`enum_class` argument must be a child of `Enum`')
@@ -29,6 +119,49 @@ class EnumChoiceField(CharField):
         # Saving original for proper deconstruction
         self._original_choice_builder = choice_builder
 
+        # Integer codes are stored in the database instead of the built values
+        # when `codes` is passed
+        self.codes = codes
+        self._code_by_member = self._build_codes(codes) if codes is not None else None
+
+        # Old stored values, which are still decoded to enumerations,
+        # but are never written
+        self.legacy_values = legacy_values
+        self._member_by_legacy_value = self._build_legacy_values(legacy_values) if legacy_values else {}
+        self._legacy_values_by_db_value = {}
+
+        for legacy_value, member in self._member_by_legacy_value.items():
+            self._legacy_values_by_db_value.setdefault(
+                self.db_value_by_member[member],
+                []
+            ).append(legacy_value)
+
+        # Name of a PostgreSQL `ENUM` type, used as the column type on PostgreSQL
+        self.postgres_enum_type = postgres_enum_type
+
+        if codes is not None and postgres_enum_type is not None:
+            raise EnumChoiceFieldException(
+                _('`codes` and `postgres_enum_type` can not be used together.')
+            )
+
+        # Restricting the column to the stored values with a `CHECK` constraint
+        self.db_check_constraint = db_check_constraint
+
+        # Decoding the stored values on attribute access instead of when loading rows
+        self.lazy = lazy
+
+        # Writing the built choices into migrations
+        self.inline_choices = inline_choices
+
+        # `check_values` is passed to `__init__` when migrations are generated
+        # with `db_check_constraint=True`, so the `CHECK` constraint follows
+        # the changes of the enumeration
+        # `check_values` should not be passed when normally initializing the field
+        self._passed_check_values = check_values if check_values is not None else self._build_check_values()
+
+        # Calculates `max_length` from the longest value
+        self.max_length_policy = max_length_policy
+
         built_choices = self.build_choices()
 
         # `choices` is passed to `__init__` when migrations are generated
@@ -40,9 +173,14 @@ class EnumChoiceField(CharField):
 
         kwargs['choices'] = built_choices
 
-        calculated_max_length = self._calculate_max_length(**kwargs)
+        if self.codes is None:
+            calculated_max_length = self._calculate_max_length()
+            policy = max_length_policy if max_length_policy is not None else ExactMaxLength()
 
-        kwargs.setdefault('max_length', calculated_max_length)
+            kwargs.setdefault('max_length', policy.get_max_length(calculated_max_length))
+        else:
+            # Integer columns have no length
+            kwargs.pop('max_length', None)
 
         super().__init__(**kwargs)
 
@@ -53,12 +191,20 @@ class EnumChoiceField(CharField):
             if not isinstance(validator, MaxLengthValidator)
         ]
 
-        self.validators.append(
-            EnumValueMaxLengthValidator(
+        # Set when the max length validator can't fail for enumerations,
+        # so `clean` can skip it
+        self._redundant_max_length_validator = None
+
+        if self.codes is None and kwargs['max_length'] is not None:
+            max_length_validator = EnumValueMaxLengthValidator(
                 value_builder=self.get_prep_value,
                 limit_value=kwargs['max_length']
             )
-        )
+            self.validators.append(max_length_validator)
+
+            if isinstance(kwargs['max_length'], int) and \
+               kwargs['max_length'] >= calculated_max_length:
+                self._redundant_max_length_validator = max_length_validator
 
     def _get_choice_builder(self, choice_builder):
         if not callable(choice_builder):
@@ -70,51 +216,323 @@ class EnumChoiceField(CharField):
 
         return as_choice_builder(choice_builder)
 
+    def _build_codes(self, codes) -> Dict[Enum, int]:
+        if callable(codes):
+            code_by_member = {
+                member: codes(member)
+                for member in self.enum_class
+            }
+        else:
+            code_by_member = dict(codes)
+
+        for member in self.enum_class:
+            if member not in code_by_member:
+                raise EnumChoiceFieldException(
+                    _('`codes` is missing a code for {}.'.format(member))
+                )
+
+            code = code_by_member[member]
+
+            if isinstance(code, bool) or not isinstance(code, int) or \
+               not SMALL_INTEGER_MIN <= code <= SMALL_INTEGER_MAX:
+                raise EnumChoiceFieldException(
+                    _('Received code {} for {}. Codes must be integers between {} and {}.'.format(
+                        repr(code), member, SMALL_INTEGER_MIN, SMALL_INTEGER_MAX
+                    ))
+                )
+
+        if len(set(code_by_member.values())) != len(code_by_member):
+            raise EnumChoiceFieldException(
+                _('Codes for {} must be unique.'.format(self.enum_class.__name__))
+            )
+
+        return code_by_member
+
+    def _build_legacy_values(self, legacy_values) -> Dict[Any, Enum]:
+        member_by_legacy_value = dict(legacy_values)
+        db_values = set(self.db_value_by_member.values())
+
+        for legacy_value, member in member_by_legacy_value.items():
+            if not isinstance(member, self.enum_class):
+                raise EnumChoiceFieldException(
+                    _('Legacy value {} must be mapped to a member of {}.'.format(
+                        repr(legacy_value), self.enum_class.__name__
+                    ))
+                )
+
+            if legacy_value in db_values:
+                raise EnumChoiceFieldException(
+                    _('Legacy value {} is a current value of {}.'.format(
+                        repr(legacy_value), self.enum_class.__name__
+                    ))
+                )
+
+        return member_by_legacy_value
+
     def build_choices(self) -> Tuple[Tuple[str]]:
-        return build_enum_choices(
-            self.enum_class,
-            self.choice_builder
+        if not hasattr(self.choice_builder, '_original_choice_builder'):
+            # `choice_builder` was replaced after initialization
+            return build_enum_choices(
+                self.enum_class,
+                self.choice_builder
+            )
+
+        # The choices are built and validated once per `enum_class` & `choice_builder`
+        return list(self.choice_map.choices)
+
+    def _calculate_max_length(self) -> int:
+        # Legacy values are still stored in the column
+        return max(
+            [self.choice_map.max_length] +
+            [len(legacy_value) for legacy_value in self._member_by_legacy_value]
+        )
+
+    @property
+    def choice_map(self):
+        return get_enum_choice_map(self.enum_class, self.choice_builder)
+
+    @property
+    def db_value_by_member(self) -> Dict[Enum, Any]:
+        if self.codes is not None:
+            return self._code_by_member
+
+        return self.choice_map.value_by_member
+
+    @cached_property
+    def _member_by_code(self) -> Dict[int, Enum]:
+        return {
+            code: member
+            for member, code in self._code_by_member.items()
+        }
+
+    @property
+    def member_by_db_value(self) -> Dict[Any, Enum]:
+        if self._member_by_legacy_value:
+            return self._member_by_db_and_legacy_value
+
+        if self.codes is not None:
+            return self._member_by_code
+
+        return self.choice_map.member_by_value
+
+    @cached_property
+    def _member_by_db_and_legacy_value(self) -> Dict[Any, Enum]:
+        if self.codes is not None:
+            member_by_db_value = dict(self._member_by_code)
+        else:
+            member_by_db_value = dict(self.choice_map.member_by_value)
+
+        member_by_db_value.update(self._member_by_legacy_value)
+
+        return member_by_db_value
+
+    def get_legacy_db_values(self, db_value) -> List[Any]:
+        """
+        Returns the legacy values, which are decoded to the same enumeration as `db_value`.
+        """
+
+        try:
+            return self._legacy_values_by_db_value.get(db_value, [])
+        except TypeError:
+            return []
+
+    def get_internal_type(self):
+        if self.codes is not None:
+            return 'SmallIntegerField'
+
+        if self.max_length is None:
+            # Unbounded values are stored in a `text` column
+            return 'TextField'
+
+        return super().get_internal_type()
+
+    def db_type(self, connection):
+        if self.postgres_enum_type is not None and connection.vendor == 'postgresql':
+            return connection.ops.quote_name(self.postgres_enum_type)
+
+        return super().db_type(connection)
+
+    def db_check(self, connection):
+        if not self.db_check_constraint or \
+           (self.postgres_enum_type is not None and connection.vendor == 'postgresql'):
+            return super().db_check(connection)
+
+        return '{} IN ({})'.format(
+            connection.ops.quote_name(self.column),
+            ', '.join(
+                self._quote_db_check_value(value)
+                for value in self._passed_check_values
+            )
         )
 
-    def _calculate_max_length(self, **kwargs) -> int:
-        max_choice_length = max(len(choice) for choice, _ in kwargs['choices'])
+    def _build_check_values(self) -> List[Any]:
+        return list(self.db_value_by_member.values()) + list(self._member_by_legacy_value)
 
-        return max_choice_length
+    def _quote_db_check_value(self, value) -> str:
+        if isinstance(value, int):
+            return str(value)
+
+        return "'{}'".format(value.replace("'", "''"))
+
+    def _check_max_length_attribute(self, **kwargs):
+        if self.codes is not None or self.max_length is None:
+            return []
+
+        return super()._check_max_length_attribute(**kwargs)
 
     def to_enum_value(self, value):
         if value is None:
             return
 
-        for choice in self.enum_class:
-            # Check if the value from the built choice matches the passed one
-            if value_from_built_choice(self.choice_builder(choice)) == value:
-                return choice
+        enum_value = self.choice_map.get_member(value)
 
-        raise ValidationError(
-            _('Value {} not found in {}'.format(value, self.enum_class))
-        )
+        if enum_value is None:
+            raise ValidationError(
+                _('Value {} not found in {}'.format(value, self.enum_class))
+            )
+
+        return enum_value
+
+    def get_choice_value(self, value):
+        """
+        Returns the value from the built choice for `value`
+        which is used by forms, serializers, filters and fixtures.
+        """
+
+        try:
+            return self.choice_map.value_by_member[value]
+        except (KeyError, TypeError):
+            return value_from_built_choice(
+                self.choice_builder(value)
+            )
 
     def get_prep_value(self, value):
-        return value_from_built_choice(
-            self.choice_builder(value)
-        )
+        if self.codes is None:
+            return self.get_choice_value(value)
+
+        try:
+            return self._code_by_member[value]
+        except (KeyError, TypeError):
+            return value
+
+    def get_db_prep_value(self, value, connection, prepared=False):
+        if prepared or type(self).get_prep_value is not EnumChoiceField.get_prep_value:
+            # Respecting `get_prep_value` overrides in subclasses
+            return super().get_db_prep_value(value, connection, prepared)
+
+        return self._get_prep_value_from_table(value)
+
+    def get_prep_values(self, values) -> List[Any]:
+        """
+        Prepares many values at once, I.E: for `bulk_create` / `bulk_update`,
+        lookups or raw SQL. The enumerations are resolved with a single dictionary lookup,
+        everything else goes through `get_prep_value`.
+        """
+
+        if type(self).get_prep_value is not EnumChoiceField.get_prep_value:
+            return [self.get_prep_value(value) for value in values]
+
+        return [self._get_prep_value_from_table(value) for value in values]
+
+    def _get_prep_value_from_table(self, value):
+        try:
+            return self._db_value_by_member[value]
+        except (KeyError, TypeError):
+            return self.get_prep_value(value)
+
+    @cached_property
+    def _db_value_by_member(self) -> Dict[Enum, Any]:
+        return dict(self.db_value_by_member)
 
     def from_db_value(self, value, expression, connection, *args):
         # Accepting `*args` because Django 1.11 calls with an extra
         # `context` argument
 
-        return self.to_enum_value(value)
+        return self._db_converter(value)
+
+    @cached_property
+    def _db_converter(self):
+        """
+        A converter with the same behaviour as `from_db_value`,
+        which resolves values with a single dictionary lookup.
+        It is built once per field and handed to Django by `get_db_converters`.
+        """
+
+        member_by_value = self.member_by_db_value
+        enum_class = self.enum_class
+
+        def converter(value, *args):
+            if value is None:
+                return value
+
+            try:
+                return member_by_value[value]
+            except KeyError:
+                raise ValidationError(
+                    _('Value {} not found in {}'.format(value, enum_class))
+                )
+
+        return converter
+
+    def contribute_to_class(self, cls, name, *args, **kwargs):
+        display_method_name = 'get_{}_display'.format(name)
+        has_own_display_method = display_method_name in cls.__dict__
+
+        super().contribute_to_class(cls, name, *args, **kwargs)
+
+        if not has_own_display_method:
+            setattr(cls, display_method_name, partialmethod(_get_enum_choice_display, field=self))
+
+        if self.lazy:
+            setattr(cls, self.attname, LazyEnumChoiceDescriptor(self))
+
+    def get_db_converters(self, connection):
+        if self.lazy:
+            # The values are decoded by `LazyEnumChoiceDescriptor`
+            return []
+
+        if type(self).from_db_value is not EnumChoiceField.from_db_value:
+            # Respecting `from_db_value` overrides in subclasses
+            return super().get_db_converters(connection)
+
+        return [self._db_converter]
 
     def to_python(self, value):
         if isinstance(value, self.enum_class):
             return value
 
+        if self.codes is not None and isinstance(value, int):
+            enum_value = self._member_by_code.get(value)
+
+            if enum_value is not None:
+                return enum_value
+
+        if self._member_by_legacy_value:
+            try:
+                enum_value = self._member_by_legacy_value.get(value)
+            except TypeError:
+                enum_value = None
+
+            if enum_value is not None:
+                return enum_value
+
         return self.to_enum_value(value)
 
     def deconstruct(self):
         name, path, args, kwargs = super().deconstruct()
 
-        kwargs['choices'] = self._passed_choices
+        if self.legacy_values:
+            kwargs['legacy_values'] = self.legacy_values
+
+        if self.max_length_policy is not None:
+            kwargs['max_length_policy'] = self.max_length_policy
+
+        if self.inline_choices:
+            kwargs['choices'] = self._passed_choices
+        else:
+            # The choices are rebuilt from `enum_class` & `choice_builder`
+            kwargs.pop('choices', None)
+            kwargs['inline_choices'] = False
 
         if self.enum_class:
             kwargs['enum_class'] = self.enum_class
@@ -122,6 +540,21 @@ class EnumChoiceField(CharField):
         if self.choice_builder:
             kwargs['choice_builder'] = self._original_choice_builder
 
+        if self.codes is not None:
+            kwargs['codes'] = self.codes
+
+        if self.postgres_enum_type is not None:
+            kwargs['postgres_enum_type'] = self.postgres_enum_type
+
+        if self.db_check_constraint:
+            kwargs['db_check_constraint'] = True
+            # The `CHECK` constraint of a field, loaded from a migration,
+            # is built from these values instead of the current enumeration
+            kwargs['check_values'] = self._passed_check_values
+
+        if self.lazy:
+            kwargs['lazy'] = True
+
         return name, path, args, kwargs
 
     def validate(self, value, *args, **kwargs):
@@ -158,11 +591,59 @@ class EnumChoiceField(CharField):
                     params={'value': value}
                 )
 
+    def clean(self, value, model_instance):
+        """
+        Resolves the enumeration once with `to_python`.
+        Enumerations are never null and are always valid choices,
+        so `validate` is skipped for them, together with the max length validator
+        when `max_length` fits all built values.
+        The raised errors are the same as the ones from `Field.clean`.
+        """
+
+        if type(self).validate is not EnumChoiceField.validate or \
+           type(self).run_validators is not Field.run_validators:
+            # Respecting `validate` and `run_validators` overrides in subclasses
+            return super().clean(value, model_instance)
+
+        value = self.to_python(value)
+
+        if not isinstance(value, self.enum_class):
+            self.validate(value, model_instance)
+            self.run_validators(value)
+
+            return value
+
+        if self.editable and not self.blank and value in self.empty_values:
+            raise ValidationError(self.error_messages['blank'], code='blank')
+
+        self._run_enum_validators(value)
+
+        return value
+
+    def _run_enum_validators(self, value):
+        # Same as `Field.run_validators`, without the redundant validator
+        errors = []
+
+        for validator in self.validators:
+            if validator is self._redundant_max_length_validator:
+                continue
+
+            try:
+                validator(value)
+            except ValidationError as e:
+                if hasattr(e, 'code') and e.code in self.error_messages:
+                    e.message = self.error_messages[e.code]
+
+                errors.extend(e.error_list)
+
+        if errors:
+            raise ValidationError(errors)
+
     def value_to_string(self, obj):
         value = self.value_from_object(obj)
-        return self.get_prep_value(value)
+        return self.get_choice_value(value)
 
-    @property
+    @cached_property
     def flatchoices(self):
         """
         Django admin uses `flatchoices` to generate a value under the
@@ -173,15 +654,30 @@ class EnumChoiceField(CharField):
         which is an enumeration instance in our case.
         Since that does not match inside the original `flatchoices`
         it sets the display value to `-`.
+
+        The choices are built only once per field.
         """
 
-        flatchoices = super()._get_flatchoices()
+        label_by_member = self.choice_map.label_by_member
 
         return [
-            (self.to_enum_value(choice), readable)
-            for choice, readable in flatchoices
+            (member, label_by_member[member])
+            for member in self.enum_class
         ]
 
+    @cached_property
+    def _formfield_choices(self) -> Dict[bool, Tuple[Tuple[str]]]:
+        """
+        The choices with and without the blank choice, passed to the form fields.
+        They are built once per field and are tuples,
+        since they are shared between all form fields.
+        """
+
+        return {
+            include_blank: tuple(self.get_choices(include_blank=include_blank))
+            for include_blank in (True, False)
+        }
+
     def formfield(self, **kwargs):
         """
         Uses `django.forms.Field`'s parameter generation with
@@ -205,7 +701,7 @@ class EnumChoiceField(CharField):
 
         include_blank = (self.blank or
                          not (self.has_default() or 'initial' in kwargs))
-        defaults['choices'] = self.get_choices(include_blank=include_blank)
+        defaults['choices'] = self._formfield_choices[include_blank]
 
         # Many of the subclass-specific formfield arguments (min_value,
         # max_value) don't apply for choice fields, so be sure to only pass
@@ -221,3 +717,246 @@ class EnumChoiceField(CharField):
         defaults.update(kwargs)
 
         return EnumChoiceFormField(**defaults)
+
+
+class EnumSetField(BigIntegerField):
+    """
+    Stores a `frozenset` of enumerations from `enum_class` as a bitmask.
+    Each enumeration gets a bit, which defaults to its position in `enum_class`.
+    """
+
+    description = _('EnumSetField for %(enum_class)')
+
+    def __init__(self, enum_class: Type[Enum], choice_builder=value_value, bits=None, **kwargs):
+        if not issubclass(enum_class, Enum):
+            raise EnumChoiceFieldException(
+                _('`enum_class` argument must be a child of `Enum`')
+            )
+
+        if not callable(choice_builder):
+            raise EnumChoiceFieldException(
+                _('`{}.choice_builder` must be a callable.'.format(
+                    enum_class.__name__
+                ))
+            )
+
+        self.enum_class = enum_class
+        self.choice_builder = as_choice_builder(choice_builder)
+
+        # Saving original for proper deconstruction
+        self._original_choice_builder = choice_builder
+
+        self.bits = bits
+        self._bit_by_member = self._build_bits(bits)
+
+        super().__init__(**kwargs)
+
+    def _build_bits(self, bits) -> Dict[Enum, int]:
+        if bits is None:
+            position_by_member = {
+                member: position
+                for position, member in enumerate(self.enum_class)
+            }
+        elif callable(bits):
+            position_by_member = {
+                member: bits(member)
+                for member in self.enum_class
+            }
+        else:
+            position_by_member = dict(bits)
+
+        for member in self.enum_class:
+            if member not in position_by_member:
+                raise EnumChoiceFieldException(
+                    _('`bits` is missing a bit for {}.'.format(member))
+                )
+
+            position = position_by_member[member]
+
+            if isinstance(position, bool) or not isinstance(position, int) or \
+               not 0 <= position < MAX_ENUM_SET_BITS:
+                raise EnumChoiceFieldException(
+                    _('Received bit {} for {}. Bits must be integers between 0 and {}.'.format(
+                        repr(position), member, MAX_ENUM_SET_BITS - 1
+                    ))
+                )
+
+        if len(set(position_by_member.values())) != len(position_by_member):
+            raise EnumChoiceFieldException(
+                _('Bits for {} must be unique.'.format(self.enum_class.__name__))
+            )
+
+        return {
+            member: 1 << position
+            for member, position in position_by_member.items()
+        }
+
+    @property
+    def choice_map(self):
+        return get_enum_choice_map(self.enum_class, self.choice_builder)
+
+    @cached_property
+    def validators(self):
+        # The range validators of `BigIntegerField` can't compare sets
+        return list(self._validators)
+
+    def to_python(self, value):
+        if value is None:
+            return value
+
+        if isinstance(value, self.enum_class):
+            return frozenset([value])
+
+        if isinstance(value, str):
+            # Serialized by `value_to_string`
+            try:
+                decoded = json.loads(value)
+            except ValueError:
+                decoded = None
+
+            if isinstance(decoded, bool) or not isinstance(decoded, (list, int)):
+                raise self._not_a_list_error(value)
+
+            value = decoded
+
+        if isinstance(value, int):
+            return self._db_converter(value)
+
+        if isinstance(value, dict):
+            raise self._not_a_list_error(value)
+
+        try:
+            items = iter(value)
+        except TypeError:
+            raise self._not_a_list_error(value)
+
+        members = []
+
+        for item in items:
+            if not isinstance(item, self.enum_class):
+                member = self.choice_map.get_member(item)
+
+                if member is None:
+                    raise ValidationError(
+                        _('Value {} not found in {}'.format(item, self.enum_class))
+                    )
+
+                item = member
+
+            members.append(item)
+
+        return frozenset(members)
+
+    def _not_a_list_error(self, value):
+        return ValidationError(
+            _('Value {} is not a list of {} values'.format(value, self.enum_class))
+        )
+
+    def get_prep_value(self, value):
+        if value is None:
+            return value
+
+        if isinstance(value, int) and not isinstance(value, self.enum_class):
+            return value
+
+        mask = 0
+
+        for member in self.to_python(value):
+            mask |= self._bit_by_member[member]
+
+        return mask
+
+    def from_db_value(self, value, expression, connection, *args):
+        # Accepting `*args` because Django 1.11 calls with an extra
+        # `context` argument
+
+        return self._db_converter(value)
+
+    @cached_property
+    def _db_converter(self):
+        bits = [
+            (bit, member)
+            for member, bit in self._bit_by_member.items()
+        ]
+        known_bits = sum(bit for bit, _ in bits)
+        enum_class = self.enum_class
+
+        def converter(value, *args):
+            if value is None:
+                return value
+
+            if value & ~known_bits:
+                raise ValidationError(
+                    _('Bitmask {} contains bits that are not in {}'.format(value, enum_class))
+                )
+
+            return frozenset(
+                member for bit, member in bits
+                if value & bit
+            )
+
+        return converter
+
+    def get_db_converters(self, connection):
+        if type(self).from_db_value is not EnumSetField.from_db_value:
+            # Respecting `from_db_value` overrides in subclasses
+            return super().get_db_converters(connection)
+
+        return [self._db_converter]
+
+    def validate(self, value, model_instance):
+        if not self.editable:
+            return
+
+        if value is None and not self.null:
+            raise ValidationError(self.error_messages['null'], code='null')
+
+        if not self.blank and not value:
+            raise ValidationError(self.error_messages['blank'], code='blank')
+
+    def value_to_string(self, obj):
+        value = self.value_from_object(obj)
+
+        if value is None:
+            return value
+
+        return json.dumps([
+            self.choice_map.value_by_member[member]
+            for member in self.enum_class
+            if member in value
+        ])
+
+    def save_form_data(self, instance, data):
+        setattr(instance, self.name, self.to_python(data))
+
+    def deconstruct(self):
+        name, path, args, kwargs = super().deconstruct()
+
+        kwargs['enum_class'] = self.enum_class
+        kwargs['choice_builder'] = self._original_choice_builder
+
+        if self.bits is not None:
+            kwargs['bits'] = self.bits
+
+        return name, path, args, kwargs
+
+    def formfield(self, **kwargs):
+        defaults = {
+            'form_class': MultipleEnumChoiceFormField,
+            'enum_class': self.enum_class,
+            'choice_builder': self.choice_builder,
+            **kwargs
+        }
+
+        # Skipping `BigIntegerField.formfield`, which passes
+        # `min_value` and `max_value` to the form field
+        return Field.formfield(self, **defaults)
+
+
+EnumChoiceField.register_lookup(EnumChoiceExact)
+EnumChoiceField.register_lookup(EnumChoiceIn)
+EnumChoiceField.register_lookup(RawEnumValue)
+
+EnumSetField.register_lookup(HasAny)
+EnumSetField.register_lookup(HasAll)
+EnumSetField.register_lookup(HasNone)
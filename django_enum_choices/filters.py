@@ -1,7 +1,7 @@
 import django_filters as filters
 
 from .fields import EnumChoiceField
-from .forms import EnumChoiceField as EnumChoiceFormField
+from .forms import EnumChoiceField as EnumChoiceFormField, MultipleEnumChoiceField as MultipleEnumChoiceFormField
 from .choice_builders import value_value
 
 
@@ -17,16 +17,44 @@ class EnumChoiceFilter(filters.ChoiceFilter):
         )
 
 
+class MultipleEnumChoiceFilter(filters.Filter):
+    """
+    Filters by many enumerations at once, given as repeated (`?field=a&field=b`)
+    and / or delimited (`?field=a,b`) query parameters.
+    The values are filtered with a single `__in` lookup.
+    """
+
+    field_class = MultipleEnumChoiceFormField
+
+    def __init__(self, enum_class, choice_builder=value_value, *args, delimiter=',', **kwargs):
+        kwargs.setdefault('lookup_expr', 'in')
+
+        super().__init__(
+            enum_class=enum_class,
+            choice_builder=choice_builder,
+            delimiter=delimiter,
+            *args,
+            **kwargs
+        )
+
+
 class EnumChoiceFilterSetMixin:
     """
     `django-filter` has specific logic for handling fields with `choices`.
     We need to override `filter_for_lookup` to return an `EnumChoiceFilter`
     before `django-filter` returns a `ChoiceFilter` as the `filter_class`
     for the `EnumChoiceField` instances in the model.
+    The `in` lookup is mapped to a `MultipleEnumChoiceFilter`.
     """
 
     @classmethod
     def filter_for_lookup(cls, field, lookup_type):
+        if isinstance(field, EnumChoiceField) and lookup_type == 'in':
+            return MultipleEnumChoiceFilter, {
+                'enum_class': field.enum_class,
+                'choice_builder': field.choice_builder
+            }
+
         if isinstance(field, EnumChoiceField):
             return EnumChoiceFilter, {
                 'enum_class': field.enum_class,
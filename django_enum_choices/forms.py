@@ -1,7 +1,8 @@
 from django import forms
 
 from .choice_builders import value_value
-from .utils import as_choice_builder, value_from_built_choice, build_enum_choices
+from .utils import as_choice_builder, value_from_built_choice, split_delimited_values
+from .registry import get_enum_choice_map
 
 
 class EnumChoiceField(forms.ChoiceField):
@@ -17,15 +18,14 @@ class EnumChoiceField(forms.ChoiceField):
         super().__init__(**kwargs)
 
     def build_choices(self):
-        return build_enum_choices(
-            self.enum_class,
-            self.choice_builder
-        )
+        return list(self.choice_map.choices)
+
+    @property
+    def choice_map(self):
+        return get_enum_choice_map(self.enum_class, self.choice_builder)
 
     def _enum_from_input_value(self, value):
-        for choice in self.enum_class:
-            if value_from_built_choice(self.choice_builder(choice)) == value:
-                return choice
+        return self.choice_map.get_member(value)
 
     def to_python(self, value):
         if value is None:
@@ -34,7 +34,10 @@ class EnumChoiceField(forms.ChoiceField):
         return self._enum_from_input_value(value) or value
 
     def prepare_value(self, value):
-        if not value or isinstance(value, self.enum_class):
+        if isinstance(value, self.enum_class):
+            return self.choice_map.value_by_member[value]
+
+        if not value:
             return value_from_built_choice(
                 self.choice_builder(value)
             )
@@ -43,3 +46,44 @@ class EnumChoiceField(forms.ChoiceField):
 
     def valid_value(self, value):
         return isinstance(value, self.enum_class) and value in self.enum_class
+
+
+class MultipleEnumChoiceField(EnumChoiceField, forms.MultipleChoiceField):
+    def __init__(self, enum_class, choice_builder=value_value, delimiter=None, **kwargs):
+        # With a `delimiter`, `'a,b'` is read as `['a', 'b']`
+        self.delimiter = delimiter
+
+        super().__init__(enum_class, choice_builder=choice_builder, **kwargs)
+
+    def to_python(self, value):
+        if self.delimiter is not None and isinstance(value, str):
+            value = [value]
+
+        if not value:
+            return []
+
+        if not isinstance(value, (list, tuple, set, frozenset)):
+            raise forms.ValidationError(
+                self.error_messages['invalid_list'],
+                code='invalid_list'
+            )
+
+        if self.delimiter is not None:
+            value = split_delimited_values(value, self.delimiter)
+
+        return [
+            super(MultipleEnumChoiceField, self).to_python(item)
+            for item in value
+        ]
+
+    def prepare_value(self, value):
+        if not value or isinstance(value, str):
+            return value
+
+        return [
+            super(MultipleEnumChoiceField, self).prepare_value(item)
+            for item in value
+        ]
+
+    def has_changed(self, initial, data):
+        return super().has_changed(self.prepare_value(initial), data)
@@ -0,0 +1,168 @@
+from collections import OrderedDict
+
+from django.core.exceptions import EmptyResultSet
+from django.db.models import CharField, Lookup, SmallIntegerField, Transform
+from django.db.models.lookups import Exact, In
+from django.utils.functional import cached_property
+
+
+class EnumChoiceExact(Exact):
+    """
+    `exact` lookup for `EnumChoiceField`, which prepares the enumeration
+    from the field's precomputed table of database values.
+    When the field has legacy values for the enumeration, they are matched too.
+    """
+
+    def get_prep_lookup(self):
+        self.legacy_values = []
+
+        if hasattr(self.rhs, 'resolve_expression') or not self.prepare_rhs:
+            return super().get_prep_lookup()
+
+        field = self.lhs.output_field
+        prepared, = field.get_prep_values([self.rhs])
+
+        self.legacy_values = field.get_legacy_db_values(prepared)
+
+        return prepared
+
+    def as_sql(self, compiler, connection):
+        if not self.legacy_values:
+            return super().as_sql(compiler, connection)
+
+        lhs, lhs_params = self.process_lhs(compiler, connection)
+        field = self.lhs.output_field
+
+        values = [
+            field.get_db_prep_value(value, connection, prepared=True)
+            for value in [self.rhs] + self.legacy_values
+        ]
+
+        return '{} IN ({})'.format(lhs, ', '.join(['%s'] * len(values))), list(lhs_params) + values
+
+
+class EnumChoiceIn(In):
+    """
+    `in` lookup for `EnumChoiceField`, which prepares the enumerations
+    from the field's precomputed table of database values and removes the duplicates.
+
+    On PostgreSQL the values are passed as a single array parameter - `= ANY(%s)`,
+    so the statement is the same regardless of the number of values.
+    The legacy values of the field for the enumerations are matched too.
+    """
+
+    def get_prep_lookup(self):
+        self.prepared_from_table = False
+
+        if hasattr(self.rhs, 'resolve_expression') or not self.prepare_rhs:
+            return super().get_prep_lookup()
+
+        values = list(self.rhs)
+
+        if any(hasattr(value, 'resolve_expression') for value in values):
+            self.rhs = values
+
+            return super().get_prep_lookup()
+
+        self.prepared_from_table = True
+        field = self.lhs.output_field
+        prepared = field.get_prep_values(values)
+
+        prepared = prepared + [
+            legacy_value
+            for value in prepared
+            for legacy_value in field.get_legacy_db_values(value)
+        ]
+
+        # `None` is never equal to a column value
+        return list(OrderedDict.fromkeys(
+            value for value in prepared if value is not None
+        ))
+
+    def as_sql(self, compiler, connection):
+        if not self.prepared_from_table or connection.vendor != 'postgresql':
+            return super().as_sql(compiler, connection)
+
+        if not self.rhs:
+            raise EmptyResultSet
+
+        lhs, lhs_params = self.process_lhs(compiler, connection)
+        field = self.lhs.output_field
+        rhs = '%s'
+
+        if getattr(field, 'postgres_enum_type', None) is not None:
+            rhs = '%s::{}[]'.format(connection.ops.quote_name(field.postgres_enum_type))
+
+        values = [
+            field.get_db_prep_value(value, connection, prepared=True)
+            for value in self.rhs
+        ]
+
+        return '{} = ANY({})'.format(lhs, rhs), list(lhs_params) + [values]
+
+
+class RawEnumValue(Transform):
+    """
+    `raw` transform for `EnumChoiceField`, which selects the value
+    stored in the database without decoding it to an enumeration,
+    I.E: `values_list('field__raw', flat=True)`.
+    """
+
+    lookup_name = 'raw'
+    template = '%(expressions)s'
+
+    @cached_property
+    def output_field(self):
+        field = self.lhs.output_field
+
+        if field.codes is not None:
+            return SmallIntegerField()
+
+        return CharField(max_length=field.max_length)
+
+
+class EnumSetLookup(Lookup):
+    """
+    Base class for `EnumSetField` lookups.
+    The passed enumerations are converted to a bitmask by the field's
+    `get_prep_value` and compared to the bitwise AND of the column and the mask.
+    """
+
+    def get_sql(self, bitwise_and, rhs):
+        raise NotImplementedError
+
+    def get_params(self, lhs_params, rhs_params):
+        return list(lhs_params) + list(rhs_params)
+
+    def as_sql(self, compiler, connection):
+        lhs, lhs_params = self.process_lhs(compiler, connection)
+        rhs, rhs_params = self.process_rhs(compiler, connection)
+
+        # `combine_expression` takes care of backends without an `&` operator
+        bitwise_and = connection.ops.combine_expression('&', [lhs, rhs])
+
+        return self.get_sql(bitwise_and, rhs), self.get_params(lhs_params, rhs_params)
+
+
+class HasAny(EnumSetLookup):
+    lookup_name = 'has_any'
+
+    def get_sql(self, bitwise_and, rhs):
+        return '{} <> 0'.format(bitwise_and)
+
+
+class HasAll(EnumSetLookup):
+    lookup_name = 'has_all'
+
+    def get_sql(self, bitwise_and, rhs):
+        return '{} = {}'.format(bitwise_and, rhs)
+
+    def get_params(self, lhs_params, rhs_params):
+        return super().get_params(lhs_params, rhs_params) + list(rhs_params)
+
+
+class HasNone(EnumSetLookup):
+    lookup_name = 'has_none'
+
+    def get_sql(self, bitwise_and, rhs):
+        return '{} = 0'.format(bitwise_and)
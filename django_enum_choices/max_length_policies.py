@@ -0,0 +1,81 @@
+from typing import Optional
+
+from django.utils.deconstruct import deconstructible
+from django.utils.translation import gettext as _
+
+from .exceptions import EnumChoiceFieldException
+
+
+class MaxLengthPolicy:
+    """
+    Calculates the `max_length` of `EnumChoiceField` from the length
+    of its longest stored value. Passed as `max_length_policy`.
+    """
+
+    def get_max_length(self, longest: int) -> Optional[int]:
+        raise NotImplementedError
+
+    def __eq__(self, other):
+        return type(self) is type(other) and self.__dict__ == other.__dict__
+
+
+@deconstructible
+class ExactMaxLength(MaxLengthPolicy):
+    """
+    `max_length` is the length of the longest value. Used by default.
+    """
+
+    def get_max_length(self, longest: int) -> int:
+        return longest
+
+
+@deconstructible
+class MinimumMaxLength(MaxLengthPolicy):
+    """
+    `max_length` is the length of the longest value, but at least `minimum`.
+    """
+
+    def __init__(self, minimum: int):
+        if minimum <= 0:
+            raise EnumChoiceFieldException(
+                _('`minimum` must be a positive integer.')
+            )
+
+        self.minimum = minimum
+
+    def get_max_length(self, longest: int) -> int:
+        return max(longest, self.minimum)
+
+
+@deconstructible
+class BucketedMaxLength(MaxLengthPolicy):
+    """
+    `max_length` is the length of the longest value, rounded up
+    to a multiple of `size`, but at least `minimum`.
+    The column changes only when a value outgrows its bucket.
+    """
+
+    def __init__(self, size: int = 16, minimum: int = 0):
+        if size <= 0:
+            raise EnumChoiceFieldException(
+                _('`size` must be a positive integer.')
+            )
+
+        self.size = size
+        self.minimum = minimum
+
+    def get_max_length(self, longest: int) -> int:
+        buckets = -(-longest // self.size)
+
+        return max(buckets * self.size, self.minimum)
+
+
+@deconstructible
+class UnboundedMaxLength(MaxLengthPolicy):
+    """
+    The field has no `max_length` and is stored in a `text` column,
+    which never changes when values are added.
+    """
+
+    def get_max_length(self, longest: int) -> None:
+        return None
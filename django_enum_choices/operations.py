@@ -0,0 +1,542 @@
+import copy
+import logging
+import time
+
+from django.db import router, transaction
+from django.db.models import Value
+from django.db.backends.utils import truncate_name
+from django.db.migrations.operations import AddField, AlterField, RemoveField, RenameField
+from django.db.migrations.operations.base import Operation
+
+logger = logging.getLogger(__name__)
+
+
+class AlterEnumChoiceFieldStorage(AlterField):
+    """
+    Changes the way an `EnumChoiceField` stores its values,
+    I.E: from the built values to integer `codes` and back,
+    converting the values of the existing rows.
+
+    A plain `AlterField` casts the column directly, which fails for
+    values like `'first'`. On PostgreSQL and SQLite, the column is converted
+    in place, so the indexes and constraints, which include other columns too,
+    are kept. PostgreSQL converts it with `ALTER COLUMN ... TYPE ... USING CASE ... END`
+    and SQLite, which accepts any value in any column, converts the values
+    after the type is changed.
+    On other database backends, the new values are written to
+    a temporary column, which then replaces the old one.
+    """
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        to_model = to_state.apps.get_model(app_label, self.model_name)
+
+        if not self.allow_migrate_model(schema_editor.connection.alias, to_model):
+            return
+
+        from_model = from_state.apps.get_model(app_label, self.model_name)
+        from_field = from_model._meta.get_field(self.name)
+        to_field = to_model._meta.get_field(self.name)
+
+        if schema_editor.connection.vendor in ('postgresql', 'sqlite'):
+            return self._convert_in_place(schema_editor, from_model, from_field, to_model, to_field)
+
+        temporary_name = '{}_enum_storage'.format(self.name)
+        temporary_field = to_field.clone()
+        temporary_field.null = True
+
+        steps = [
+            AddField(self.model_name, temporary_name, temporary_field),
+            RemoveField(self.model_name, self.name),
+            RenameField(self.model_name, temporary_name, self.name),
+            AlterField(self.model_name, self.name, to_field.clone()),
+        ]
+
+        state = from_state.clone()
+
+        for step in steps:
+            new_state = state.clone()
+            step.state_forwards(app_label, new_state)
+            step.database_forwards(app_label, schema_editor, state, new_state)
+
+            if isinstance(step, AddField):
+                self._copy_values(
+                    schema_editor,
+                    new_state.apps.get_model(app_label, self.model_name),
+                    from_field,
+                    to_field,
+                    temporary_name
+                )
+
+            state = new_state
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        self.database_forwards(app_label, schema_editor, from_state, to_state)
+
+    def _convert_in_place(self, schema_editor, from_model, from_field, to_model, to_field):
+        # The single column indexes and constraints of the field can't survive
+        # the change of the type (I.E: the `_like` index or the `CHECK` constraint),
+        # so they are removed before the conversion and added after it
+        interim_from_field = self._without_column_indexes(from_field)
+        interim_to_field = self._without_column_indexes(to_field)
+        interim_to_field.null = from_field.null
+
+        schema_editor.alter_field(from_model, from_field, interim_from_field)
+
+        quote_name = schema_editor.quote_name
+        table = quote_name(from_model._meta.db_table)
+        column = quote_name(from_field.column)
+        cases, params = self._build_cases(from_field, to_field)
+
+        if schema_editor.connection.vendor == 'postgresql':
+            sql = 'ALTER TABLE {table} ALTER COLUMN {column} TYPE {type} USING (CASE {column} {cases} END)::{type}'
+        else:
+            # The old values are copied unchanged to the column with the new type
+            schema_editor.alter_field(from_model, interim_from_field, interim_to_field)
+            sql = 'UPDATE {table} SET {column} = CASE {column} {cases} END'
+
+        schema_editor.execute(
+            sql.format(
+                table=table,
+                column=column,
+                type=to_field.db_type(schema_editor.connection),
+                cases=' '.join(cases)
+            ),
+            params
+        )
+
+        schema_editor.alter_field(to_model, interim_to_field, to_field)
+
+    def _without_column_indexes(self, field):
+        field = copy.copy(field)
+        field.db_index = False
+        field._unique = False
+        field.db_check_constraint = False
+
+        return field
+
+    def _build_cases(self, from_field, to_field):
+        cases = []
+        params = []
+
+        for member in to_field.enum_class:
+            cases.append('WHEN %s THEN %s')
+            params.extend([
+                from_field.get_prep_value(member),
+                to_field.get_prep_value(member)
+            ])
+
+        return cases, params
+
+    def _copy_values(self, schema_editor, model, from_field, to_field, temporary_name):
+        quote_name = schema_editor.quote_name
+        temporary_field = model._meta.get_field(temporary_name)
+        cases, params = self._build_cases(from_field, to_field)
+
+        sql = 'UPDATE {table} SET {temporary_column} = CASE {column} {cases} END'.format(
+            table=quote_name(model._meta.db_table),
+            temporary_column=quote_name(temporary_field.column),
+            column=quote_name(from_field.column),
+            cases=' '.join(cases)
+        )
+
+        schema_editor.execute(sql, params)
+
+    def describe(self):
+        return 'Alter field {} on {} converting the stored enum values'.format(
+            self.name,
+            self.model_name
+        )
+
+
+class AlterEnumChoiceFieldCheck(AlterField):
+    """
+    An `AlterField` for `EnumChoiceField(db_check_constraint=True)`,
+    which replaces the field's `CHECK` constraint without locking the table
+    for the whole validation of the existing rows on PostgreSQL.
+
+    The new constraint is added as `NOT VALID`, which only needs a short lock,
+    and is validated with a separate `VALIDATE CONSTRAINT`, which doesn't
+    block reads and writes. Mark the migration with `atomic = False`,
+    so the locks of the two statements are not held until the end of the migration.
+
+    On other database backends it behaves like `AlterField`.
+    """
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor != 'postgresql':
+            return super().database_forwards(app_label, schema_editor, from_state, to_state)
+
+        to_model = to_state.apps.get_model(app_label, self.model_name)
+
+        if not self.allow_migrate_model(schema_editor.connection.alias, to_model):
+            return
+
+        from_model = from_state.apps.get_model(app_label, self.model_name)
+        from_field = from_model._meta.get_field(self.name)
+        to_field = to_model._meta.get_field(self.name)
+
+        # Altering everything except the check constraint
+        schema_editor.alter_field(
+            from_model,
+            self._without_check_constraint(from_field),
+            self._without_check_constraint(to_field)
+        )
+
+        old_check = from_field.db_parameters(connection=schema_editor.connection)['check']
+        check = to_field.db_parameters(connection=schema_editor.connection)['check']
+
+        if old_check == check:
+            return
+
+        quote_name = schema_editor.quote_name
+        table = to_model._meta.db_table
+
+        if old_check:
+            # Only the field's own constraint is dropped,
+            # the ones from `Meta.constraints` are kept
+            constraint_names = schema_editor._constraint_names(
+                from_model,
+                [from_field.column],
+                check=True,
+                exclude={
+                    constraint.name
+                    for model in (from_model, to_model)
+                    for constraint in model._meta.constraints
+                }
+            )
+
+            for name in constraint_names:
+                schema_editor.execute(
+                    schema_editor.sql_delete_check % {
+                        'table': quote_name(table),
+                        'name': quote_name(name),
+                    }
+                )
+
+        if not check:
+            return
+
+        name = truncate_name(
+            '{}_{}_enum_check'.format(table, to_field.column),
+            schema_editor.connection.ops.max_name_length()
+        )
+
+        schema_editor.execute(
+            'ALTER TABLE {} ADD CONSTRAINT {} CHECK ({}) NOT VALID'.format(
+                quote_name(table),
+                quote_name(name),
+                check
+            )
+        )
+        schema_editor.execute(
+            'ALTER TABLE {} VALIDATE CONSTRAINT {}'.format(
+                quote_name(table),
+                quote_name(name)
+            )
+        )
+
+    def _without_check_constraint(self, field):
+        field = copy.copy(field)
+        field.db_check_constraint = False
+
+        return field
+
+    def describe(self):
+        return 'Alter field {} on {} validating its check constraint separately'.format(
+            self.name,
+            self.model_name
+        )
+
+
+class PostgresEnumTypeOperation(Operation):
+    """
+    Base class for operations on PostgreSQL `ENUM` types,
+    used by `EnumChoiceField(postgres_enum_type=...)`.
+
+    On other database backends the field is stored as a `varchar`
+    so the operations do nothing.
+    """
+
+    reduces_to_sql = True
+
+    def state_forwards(self, app_label, state):
+        pass
+
+    def _should_run(self, app_label, schema_editor):
+        return schema_editor.connection.vendor == 'postgresql' and \
+            router.allow_migrate(schema_editor.connection.alias, app_label)
+
+
+class CreatePostgresEnumType(PostgresEnumTypeOperation):
+    """
+    Creates a PostgreSQL `ENUM` type.
+    `values` can be generated with `django_enum_choices.utils.build_enum_values`.
+    """
+
+    reversible = True
+
+    def __init__(self, name, values):
+        self.name = name
+        self.values = list(values)
+
+    def _create(self, schema_editor):
+        schema_editor.execute(
+            'CREATE TYPE {} AS ENUM ({})'.format(
+                schema_editor.quote_name(self.name),
+                ', '.join(['%s'] * len(self.values))
+            ),
+            self.values
+        )
+
+    def _drop(self, schema_editor):
+        schema_editor.execute(
+            'DROP TYPE {}'.format(schema_editor.quote_name(self.name))
+        )
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        if self._should_run(app_label, schema_editor):
+            self._create(schema_editor)
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        if self._should_run(app_label, schema_editor):
+            self._drop(schema_editor)
+
+    def describe(self):
+        return 'Create PostgreSQL enum type {}'.format(self.name)
+
+
+class DropPostgresEnumType(CreatePostgresEnumType):
+    """
+    Drops a PostgreSQL `ENUM` type.
+    `values` are needed to recreate the type when the operation is reversed.
+    """
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        if self._should_run(app_label, schema_editor):
+            self._drop(schema_editor)
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        if self._should_run(app_label, schema_editor):
+            self._create(schema_editor)
+
+    def describe(self):
+        return 'Drop PostgreSQL enum type {}'.format(self.name)
+
+
+class AddPostgresEnumValue(PostgresEnumTypeOperation):
+    """
+    Adds a value to a PostgreSQL `ENUM` type. The value is added last,
+    unless `before` or `after` is passed.
+
+    PostgreSQL can not remove values from `ENUM` types,
+    so the operation is not reversible.
+    PostgreSQL versions older than 12 can not add values inside a transaction,
+    so the migration should be marked with `atomic = False` for them.
+    """
+
+    reversible = False
+
+    def __init__(self, name, value, before=None, after=None):
+        if before is not None and after is not None:
+            raise ValueError('Only one of `before` and `after` can be passed.')
+
+        self.name = name
+        self.value = value
+        self.before = before
+        self.after = after
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        if not self._should_run(app_label, schema_editor):
+            return
+
+        sql = 'ALTER TYPE {} ADD VALUE IF NOT EXISTS %s'.format(
+            schema_editor.quote_name(self.name)
+        )
+        params = [self.value]
+
+        if self.before is not None:
+            sql += ' BEFORE %s'
+            params.append(self.before)
+
+        if self.after is not None:
+            sql += ' AFTER %s'
+            params.append(self.after)
+
+        schema_editor.execute(sql, params)
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        raise NotImplementedError(
+            'Values can not be removed from PostgreSQL enum types.'
+        )
+
+    def describe(self):
+        return 'Add value {} to PostgreSQL enum type {}'.format(self.value, self.name)
+
+
+class RenamePostgresEnumValue(PostgresEnumTypeOperation):
+    """
+    Renames a value of a PostgreSQL `ENUM` type (requires PostgreSQL 10).
+    Rows with the old value get the new one, without being rewritten.
+    """
+
+    reversible = True
+
+    def __init__(self, name, old_value, new_value):
+        self.name = name
+        self.old_value = old_value
+        self.new_value = new_value
+
+    def _rename(self, schema_editor, old_value, new_value):
+        schema_editor.execute(
+            'ALTER TYPE {} RENAME VALUE %s TO %s'.format(
+                schema_editor.quote_name(self.name)
+            ),
+            [old_value, new_value]
+        )
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        if self._should_run(app_label, schema_editor):
+            self._rename(schema_editor, self.old_value, self.new_value)
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        if self._should_run(app_label, schema_editor):
+            self._rename(schema_editor, self.new_value, self.old_value)
+
+    def describe(self):
+        return 'Rename value {} of PostgreSQL enum type {} to {}'.format(
+            self.old_value,
+            self.name,
+            self.new_value
+        )
+
+
+class RemapEnumValues(Operation):
+    """
+    Replaces the values, stored in an `EnumChoiceField` column,
+    I.E: when options of the enumeration are changed or removed.
+    `mapping` maps the old stored values to the new ones (built values or codes, or `None`).
+
+    The rows are updated in chunks of `chunk_size`, ordered by primary key,
+    each chunk in its own transaction, sleeping `sleep` seconds between the chunks.
+    Mark the migration with `atomic = False`, so every chunk is committed separately.
+
+    Only rows that still have an old value are selected, so an interrupted
+    migration can be run again and continues with the remaining rows.
+
+    The operation is reversible when no two old values are mapped to the same new value
+    and no value is mapped to `None`.
+    """
+
+    reduces_to_sql = False
+
+    def __init__(self, model_name, name, mapping, chunk_size=1000, sleep=0):
+        self.model_name = model_name
+        self.name = name
+        self.mapping = dict(mapping)
+        self.chunk_size = chunk_size
+        self.sleep = sleep
+
+        if chunk_size <= 0:
+            raise ValueError('`chunk_size` must be a positive integer.')
+
+        new_values = list(self.mapping.values())
+
+        if set(self.mapping) & set(new_values):
+            raise ValueError('Values can not be both remapped and remapped to.')
+
+        self.reversible = None not in new_values and len(set(new_values)) == len(new_values)
+
+    @property
+    def model_name_lower(self):
+        return self.model_name.lower()
+
+    def state_forwards(self, app_label, state):
+        pass
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        self._remap(app_label, schema_editor, to_state, self.mapping)
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        if not self.reversible:
+            raise NotImplementedError(
+                'Values mapped to the same value or to `None` can not be restored.'
+            )
+
+        self._remap(
+            app_label,
+            schema_editor,
+            to_state,
+            {new_value: old_value for old_value, new_value in self.mapping.items()}
+        )
+
+    def _remap(self, app_label, schema_editor, state, mapping):
+        model = state.apps.get_model(app_label, self.model_name)
+        using = schema_editor.connection.alias
+
+        if not self.allow_migrate_model(using, model):
+            return
+
+        # Comparing the stored values through the `raw` transform,
+        # since the old values may not be in the enumeration anymore
+        raw_name = '{}__raw'.format(self.name)
+
+        queryset = model._base_manager.using(using)
+        remaining = queryset.filter(**{
+            '{}__in'.format(raw_name): list(mapping)
+        }).order_by('pk')
+
+        last_pk = None
+        total = 0
+
+        while True:
+            chunk = remaining if last_pk is None else remaining.filter(pk__gt=last_pk)
+            pks = list(chunk.values_list('pk', flat=True)[:self.chunk_size])
+
+            if not pks:
+                break
+
+            with transaction.atomic(using=using):
+                for old_value, new_value in mapping.items():
+                    total += queryset.filter(
+                        pk__gte=pks[0],
+                        pk__lte=pks[-1],
+                        **{raw_name: old_value}
+                    ).update(**{self.name: Value(new_value)})
+
+            last_pk = pks[-1]
+
+            logger.info(
+                'Remapped %s rows of %s.%s.%s (last primary key: %s).',
+                total,
+                app_label,
+                self.model_name,
+                self.name,
+                last_pk
+            )
+
+            if self.sleep:
+                time.sleep(self.sleep)
+
+    def describe(self):
+        return 'Remap values of field {} on {}'.format(self.name, self.model_name)
+
+
+class RenameEnumValue(RemapEnumValues):
+    """
+    Replaces `old_value` with `new_value` in an `EnumChoiceField` column,
+    the same way as `RemapEnumValues`.
+    """
+
+    def __init__(self, model_name, name, old_value, new_value, chunk_size=1000, sleep=0):
+        self.old_value = old_value
+        self.new_value = new_value
+
+        super().__init__(model_name, name, {old_value: new_value}, chunk_size=chunk_size, sleep=sleep)
+
+    def describe(self):
+        return 'Rename value {} of field {} on {} to {}'.format(
+            self.old_value,
+            self.name,
+            self.model_name,
+            self.new_value
+        )
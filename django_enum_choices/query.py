@@ -0,0 +1,131 @@
+from collections import OrderedDict
+from typing import Any, Dict
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db import connections, models, transaction
+from django.db.models import Count, Value
+
+from .fields import EnumChoiceField
+
+
+class EnumChoiceQuerySetMixin:
+    """
+    Adds `EnumChoiceField` specific helpers to a `QuerySet`.
+    """
+
+    def _get_enum_choice_field(self, field_name: str) -> EnumChoiceField:
+        field = self.model._meta.get_field(field_name)
+
+        if not isinstance(field, EnumChoiceField):
+            raise ValueError(
+                '{}.{} is not an EnumChoiceField.'.format(self.model.__name__, field_name)
+            )
+
+        return field
+
+    def values_list(self, *fields, raw_enums=False, **kwargs):
+        """
+        With `raw_enums=True`, the `EnumChoiceField` columns are returned
+        as they are stored in the database, without decoding them to enumerations,
+        by selecting them through the `raw` transform.
+        """
+
+        if raw_enums:
+            fields = [
+                self._get_raw_enum_field_name(field_name)
+                for field_name in fields or [field.attname for field in self.model._meta.concrete_fields]
+            ]
+
+        return super().values_list(*fields, **kwargs)
+
+    def _get_raw_enum_field_name(self, field_name):
+        if not isinstance(field_name, str):
+            return field_name
+
+        try:
+            field = self.model._meta.get_field(field_name)
+        except FieldDoesNotExist:
+            return field_name
+
+        if isinstance(field, EnumChoiceField):
+            return '{}__raw'.format(field_name)
+
+        return field_name
+
+    def bulk_update_enum(self, field_name: str, values: Dict[Any, Any], batch_size: int = None) -> int:
+        """
+        Sets `field_name` of the rows with the primary keys from `values`
+        to the enumerations they are mapped to, I.E: `{pk: MyEnum.A}`.
+
+        Unlike `bulk_update`, which builds a `CASE WHEN pk = ... THEN ...`
+        expression with a branch for every object, the primary keys are grouped by
+        enumeration and every group is updated with `UPDATE ... WHERE pk IN (...)`.
+        Each enumeration is prepared for the database once.
+
+        Returns the number of updated rows.
+        """
+
+        field = self._get_enum_choice_field(field_name)
+
+        if batch_size is not None and batch_size <= 0:
+            raise ValueError('Batch size must be a positive integer.')
+
+        pks_by_member = OrderedDict()
+
+        for pk, member in values.items():
+            member = field.to_python(member)
+            pks_by_member.setdefault(member, []).append(pk)
+
+        connection = connections[self.db]
+        updated = 0
+
+        with transaction.atomic(using=self.db, savepoint=False):
+            for member, pks in pks_by_member.items():
+                prepared = None if member is None else field.get_prep_value(member)
+                max_batch_size = connection.ops.bulk_batch_size(['pk'], pks)
+                member_batch_size = min(batch_size, max_batch_size) if batch_size else max_batch_size
+
+                for start in range(0, len(pks), member_batch_size):
+                    updated += self.filter(pk__in=pks[start:start + member_batch_size]).update(
+                        **{field_name: Value(prepared)}
+                    )
+
+        return updated
+
+    def enum_counts(self, field_name: str) -> Dict[Any, int]:
+        """
+        Counts the rows for every enumeration of `field_name` with a single `GROUP BY` query.
+
+        Returns an `OrderedDict`, which has an entry for every enumeration,
+        in the order of the enumeration class, including the ones without rows.
+        `None` is included, after the enumerations, only when there are rows without a value.
+        """
+
+        field = self._get_enum_choice_field(field_name)
+
+        raw_field_name = self._get_raw_enum_field_name(field_name)
+
+        counts = OrderedDict((member, 0) for member in field.enum_class)
+
+        rows = self.order_by().values(raw_field_name).annotate(
+            enum_count=Count('pk')
+        ).values_list(raw_field_name, 'enum_count')
+
+        # The stored values are decoded here, because the converter
+        # of the field is not used for `lazy` fields
+        decode = field._db_converter
+
+        for db_value, count in rows:
+            member = decode(db_value)
+            # Legacy values are grouped apart from the current value of their enumeration
+            counts[member] = counts.get(member, 0) + count
+
+        return counts
+
+
+class EnumChoiceQuerySet(EnumChoiceQuerySetMixin, models.QuerySet):
+    pass
+
+
+class EnumChoiceManager(models.Manager.from_queryset(EnumChoiceQuerySet)):
+    pass
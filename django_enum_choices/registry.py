@@ -0,0 +1,75 @@
+from enum import Enum
+from typing import Callable
+
+from .utils import as_choice_builder, build_enum_choices
+
+
+class EnumChoiceMap:
+    """
+    Holds the choices, built from an `enum_class` with a `choice_builder`,
+    together with the lookup tables between enumerations and their
+    built values.
+
+    Instances are shared between every model, form, serializer and filter field
+    that uses the same `enum_class` and `choice_builder` and must not be mutated.
+    """
+
+    def __init__(self, enum_class: Enum, choice_builder: Callable):
+        self.enum_class = enum_class
+
+        built_choices = build_enum_choices(enum_class, choice_builder)
+
+        self.choices = tuple(built_choices)
+        self.max_length = max(len(value) for value, _ in built_choices)
+        self.value_by_member = {}
+        self.member_by_value = {}
+        self.label_by_member = {}
+
+        for member, (value, label) in zip(enum_class, built_choices):
+            self.value_by_member[member] = value
+            # Keeping the first enumeration when many build the same value
+            self.member_by_value.setdefault(value, member)
+            self.label_by_member[member] = label
+
+    def get_member(self, value):
+        """
+        Returns the enumeration, whose built value is `value`
+        or `None` if there is no such enumeration.
+        """
+
+        try:
+            return self.member_by_value.get(value)
+        except TypeError:
+            # Unhashable values (lists, dicts, etc.) can't be built values
+            return None
+
+
+_registry = {}
+
+
+def get_enum_choice_map(enum_class: Enum, choice_builder: Callable) -> EnumChoiceMap:
+    """
+    Returns the shared `EnumChoiceMap` for `enum_class` and `choice_builder`.
+    The map is built on the first call and reused afterwards.
+
+    `choice_builder` can be either the original choice builder
+    or the one, returned from `as_choice_builder`.
+    """
+
+    original_choice_builder = getattr(
+        choice_builder,
+        '_original_choice_builder',
+        choice_builder
+    )
+    key = (enum_class, original_choice_builder)
+
+    choice_map = _registry.get(key)
+
+    if choice_map is None:
+        choice_map = EnumChoiceMap(
+            enum_class,
+            as_choice_builder(original_choice_builder)
+        )
+        _registry[key] = choice_map
+
+    return choice_map
@@ -1,15 +1,24 @@
+from collections import OrderedDict
+
+from django.db import models
 from django.utils.translation import gettext_lazy as _
 
 from rest_framework import serializers
+from rest_framework.fields import SkipField
+from rest_framework.relations import PKOnlyObject
+from rest_framework.utils import html
 from rest_framework.utils.field_mapping import get_field_kwargs
 
-from .fields import EnumChoiceField as ModelEnumChoiceField
+from .fields import EnumChoiceField as ModelEnumChoiceField, EnumSetField as ModelEnumSetField
 from .choice_builders import value_value
-from .utils import as_choice_builder, value_from_built_choice
+from .utils import as_choice_builder, value_from_built_choice, split_delimited_values
+from .registry import get_enum_choice_map
 
 NO_KEY_MSG = _('Key {failing_key} is not a valid {enum_class_name}')
 NOT_A_LIST_MSG = _('Expected a list of items but got type "{input_type}".')
 EMPTY_MSG = _('This selection may not be empty.')
+MAX_LENGTH_MSG = _('Ensure this field has no more than {max_length} elements.')
+MIN_LENGTH_MSG = _('Ensure this field has at least {min_length} elements.')
 
 
 class EnumChoiceField(serializers.Field):
@@ -22,15 +31,50 @@ class EnumChoiceField(serializers.Field):
         self.enum_class = enum_class
         self.choice_builder = as_choice_builder(choice_builder)
 
+        # DRF deep-copies declared fields by calling `__init__` again,
+        # so every copy is bound to the same shared map
+        self.choice_map = get_enum_choice_map(self.enum_class, self.choice_builder)
+        self._member_by_value = self.choice_map.member_by_value
+        self._value_by_member = self.choice_map.value_by_member
+
     def to_representation(self, value):
-        return value_from_built_choice(
-            self.choice_builder(value)
-        )
+        try:
+            return self._value_by_member[value]
+        except (KeyError, TypeError):
+            return value_from_built_choice(
+                self.choice_builder(value)
+            )
+
+    def to_representation_column(self, values):
+        """
+        Returns the representations of many values at once,
+        used by `EnumChoiceListSerializer`. `None` values stay `None`.
+        """
+
+        value_by_member = self._value_by_member
+        column = []
+
+        for value in values:
+            if value is None:
+                column.append(None)
+                continue
+
+            try:
+                column.append(value_by_member[value])
+            except (KeyError, TypeError):
+                column.append(self.to_representation(value))
+
+        return column
 
     def to_internal_value(self, value):
-        for choice in self.enum_class:
-            if value_from_built_choice(self.choice_builder(choice)) == value:
-                return choice
+        try:
+            choice = self._member_by_value.get(value)
+        except TypeError:
+            # Unhashable values (lists, dicts, etc.) can't be built values
+            choice = None
+
+        if choice is not None:
+            return choice
 
         self.fail(
             'non_existent_key',
@@ -43,11 +87,19 @@ class MultipleEnumChoiceField(EnumChoiceField):
     default_error_messages = {
         'non_existent_key': NO_KEY_MSG,
         'not_a_list': NOT_A_LIST_MSG,
-        'empty': EMPTY_MSG
+        'empty': EMPTY_MSG,
+        'max_length': MAX_LENGTH_MSG,
+        'min_length': MIN_LENGTH_MSG
     }
 
     def __init__(self, *args, **kwargs):
         self.allow_empty = kwargs.pop('allow_empty', False)
+        self.as_set = kwargs.pop('as_set', False)
+        self.unique = kwargs.pop('unique', False)
+        self.max_length = kwargs.pop('max_length', None)
+        self.min_length = kwargs.pop('min_length', None)
+        # With a `delimiter`, `'a,b'` is read as `['a', 'b']`
+        self.delimiter = kwargs.pop('delimiter', None)
 
         super().__init__(*args, **kwargs)
 
@@ -56,30 +108,159 @@ class MultipleEnumChoiceField(EnumChoiceField):
 
         }
 
+    def get_value(self, dictionary):
+        # Repeated keys of form data and query parameters - `?field=a&field=b`
+        if html.is_html_input(dictionary) and self.field_name in dictionary:
+            return dictionary.getlist(self.field_name)
+
+        return super().get_value(dictionary)
+
     def to_internal_value(self, data):
+        if self.delimiter is not None:
+            if isinstance(data, str):
+                data = [data]
+
+            if isinstance(data, list):
+                data = split_delimited_values(data, self.delimiter)
+
         if not isinstance(data, list):
             self.fail('not_a_list', input_type=type(data).__name__)
 
         if not self.allow_empty and not data:
             self.fail('empty')
 
-        return [
+        # The size is checked before decoding, so oversized lists fail fast
+        if self.max_length is not None and len(data) > self.max_length:
+            self.fail('max_length', max_length=self.max_length)
+
+        if self.min_length is not None and len(data) < self.min_length:
+            self.fail('min_length', min_length=self.min_length)
+
+        members = [
             super(MultipleEnumChoiceField, self).to_internal_value(value)
             for value in data
         ]
 
+        if self.as_set:
+            return frozenset(members)
+
+        if self.unique:
+            # Removes the duplicates, keeping the first occurrence of every enumeration
+            return list(OrderedDict.fromkeys(members))
+
+        return members
+
     def to_representation(self, data):
+        data = list(data)
+        value_by_member = self._value_by_member
+
+        try:
+            return [value_by_member[value] for value in data]
+        except (KeyError, TypeError):
+            return [
+                super(MultipleEnumChoiceField, self).to_representation(value)
+                for value in data
+            ]
+
+    def to_representation_column(self, values):
         return [
-            super(MultipleEnumChoiceField, self).to_representation(value)
-            for value in data
+            None if value is None else self.to_representation(value)
+            for value in values
+        ]
+
+
+class EnumSetField(MultipleEnumChoiceField):
+    def __init__(self, *args, **kwargs):
+        kwargs.setdefault('as_set', True)
+
+        super().__init__(*args, **kwargs)
+
+    def to_representation(self, data):
+        # Sets have no order, so the values are listed in the order of `enum_class`
+        return super().to_representation([
+            member for member in self.enum_class
+            if member in data
+        ])
+
+
+class EnumChoiceListSerializer(serializers.ListSerializer):
+    """
+    A `ListSerializer`, which encodes the enum fields of the child serializer
+    a whole column at a time, instead of once per object.
+    Used as `Meta.list_serializer_class` of the child serializer.
+    """
+
+    def to_representation(self, data):
+        if type(self.child).to_representation is not serializers.Serializer.to_representation:
+            # Respecting `to_representation` overrides in the child serializer
+            return super().to_representation(data)
+
+        iterable = data.all() if isinstance(data, models.Manager) else data
+        instances = list(iterable)
+
+        fields = list(self.child._readable_fields)
+        columns = {}
+
+        for field in fields:
+            if not isinstance(field, EnumChoiceField):
+                continue
+
+            try:
+                attributes = [field.get_attribute(instance) for instance in instances]
+            except SkipField:
+                continue
+
+            columns[field.field_name] = field.to_representation_column(attributes)
+
+        return [
+            self._to_row_representation(instance, index, fields, columns)
+            for index, instance in enumerate(instances)
         ]
 
+    def _to_row_representation(self, instance, index, fields, columns):
+        # Same as `Serializer.to_representation`, taking the enum fields from `columns`
+        ret = OrderedDict()
+
+        for field in fields:
+            if field.field_name in columns:
+                ret[field.field_name] = columns[field.field_name][index]
+                continue
+
+            try:
+                attribute = field.get_attribute(instance)
+            except SkipField:
+                continue
+
+            check_for_none = attribute.pk if isinstance(attribute, PKOnlyObject) else attribute
+
+            if check_for_none is None:
+                ret[field.field_name] = None
+            else:
+                ret[field.field_name] = field.to_representation(attribute)
+
+        return ret
+
 
 class EnumChoiceModelSerializerMixin:
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
-        self.serializer_field_mapping[ModelEnumChoiceField] = EnumChoiceField
+        self._register_enum_choice_field_mapping()
+
+    @classmethod
+    def _register_enum_choice_field_mapping(cls):
+        # Done once per serializer class, with a copy of the inherited mapping,
+        # so `serializers.ModelSerializer.serializer_field_mapping` is not changed
+        if '_enum_choice_field_cache' in cls.__dict__:
+            return
+
+        cls.serializer_field_mapping = {
+            **cls.serializer_field_mapping,
+            ModelEnumChoiceField: EnumChoiceField
+        }
+
+        # `(field_class, kwargs)` of the enum fields, built by `build_standard_field`
+        cls._enum_choice_field_cache = {}
 
     def build_standard_field(self, field_name, model_field):
         """
@@ -92,24 +273,47 @@ class EnumChoiceModelSerializerMixin:
         to a `Response`.
         """
 
+        if not isinstance(model_field, (ModelEnumChoiceField, ModelEnumSetField)):
+            return super().build_standard_field(field_name, model_field)
+
+        self._register_enum_choice_field_mapping()
+
+        cache = type(self)._enum_choice_field_cache
+        key = (field_name, model_field)
+
+        if key not in cache:
+            cache[key] = self._build_enum_field(field_name, model_field)
+
+        field_class, kwargs = cache[key]
+
+        # `ModelSerializer.build_field` updates the kwargs with `extra_kwargs`
+        return field_class, dict(kwargs)
+
+    def _build_enum_field(self, field_name, model_field):
         if isinstance(model_field, ModelEnumChoiceField):
-            # These are kwargs, generated by `get_field_kwargs`
-            # but are not needed for our field.
-            # `model_field` is used only in children of DRF's `ModelField`
-            # `choices` is not used because we use `field.enum_class` to validate the choice
-            # `max_length` is generated from the model field's max_length and we don't use it
-            dump_kwargs = ('model_field', 'choices', 'max_length', 'allow_blank')
-
-            initial_kwargs = {
-                'enum_class': model_field.enum_class,
-                'choice_builder': model_field.choice_builder,
-                **get_field_kwargs(field_name, model_field)
-            }
-            finalized_kwargs = {
-                key: value for key, value in initial_kwargs.items()
-                if key not in dump_kwargs
-            }
-
-            return EnumChoiceField, finalized_kwargs
-
-        return super().build_standard_field(field_name, model_field)
+            return EnumChoiceField, self._build_enum_field_kwargs(field_name, model_field)
+
+        kwargs = self._build_enum_field_kwargs(field_name, model_field)
+        kwargs['allow_empty'] = model_field.blank
+
+        return EnumSetField, kwargs
+
+    def _build_enum_field_kwargs(self, field_name, model_field):
+        # These are kwargs, generated by `get_field_kwargs`
+        # but are not needed for our field.
+        # `model_field` is used only in children of DRF's `ModelField`
+        # `choices` is not used because we use `field.enum_class` to validate the choice
+        # `max_length` is generated from the model field's max_length and we don't use it
+        # `min_value` and `max_value` are generated for the integer column of `EnumSetField`
+        dump_kwargs = ('model_field', 'choices', 'max_length', 'allow_blank', 'min_value', 'max_value')
+
+        initial_kwargs = {
+            'enum_class': model_field.enum_class,
+            'choice_builder': model_field.choice_builder,
+            **get_field_kwargs(field_name, model_field)
+        }
+
+        return {
+            key: value for key, value in initial_kwargs.items()
+            if key not in dump_kwargs
+        }
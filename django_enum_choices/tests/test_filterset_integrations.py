@@ -1,9 +1,10 @@
+from django.http import QueryDict
 from django.test import TestCase
 
 import django_filters as filters
 from django_filters import rest_framework as drf_filters
 
-from django_enum_choices.filters import EnumChoiceFilter, EnumChoiceFilterSetMixin
+from django_enum_choices.filters import EnumChoiceFilter, EnumChoiceFilterSetMixin, MultipleEnumChoiceFilter
 
 from .testapp.enumerations import CharTestEnum
 from .testapp.models import (
@@ -84,6 +85,62 @@ class FilterSetIntegrationTests(TestCase):
         self.assertEqual(filterset.qs.first().enumeration, CharTestEnum.FIRST)
 
 
+class MultipleEnumChoiceFilterSetIntegrationTests(TestCase):
+    class ExplicitFilterSet(filters.FilterSet):
+        enumeration = MultipleEnumChoiceFilter(CharTestEnum)
+
+    class ImplicitFilterSet(EnumChoiceFilterSetMixin, filters.FilterSet):
+        class Meta:
+            model = StringEnumeratedModel
+            fields = {'enumeration': ['exact', 'in']}
+
+    def setUp(self):
+        for choice in CharTestEnum:
+            StringEnumeratedModel.objects.create(
+                enumeration=choice
+            )
+
+    def filter(self, filterset_class, query_string):
+        filterset = filterset_class(QueryDict(query_string), StringEnumeratedModel.objects.all())
+
+        return set(filterset.qs.values_list('enumeration', flat=True))
+
+    def test_filters_by_delimited_values(self):
+        result = self.filter(self.ExplicitFilterSet, 'enumeration=first,third')
+
+        self.assertEqual({CharTestEnum.FIRST, CharTestEnum.THIRD}, result)
+
+    def test_filters_by_repeated_and_delimited_values(self):
+        result = self.filter(self.ExplicitFilterSet, 'enumeration=first&enumeration=second,first')
+
+        self.assertEqual({CharTestEnum.FIRST, CharTestEnum.SECOND}, result)
+
+    def test_filters_with_a_single_in_lookup(self):
+        filterset = self.ExplicitFilterSet(
+            QueryDict('enumeration=first&enumeration=second&enumeration=third'),
+            StringEnumeratedModel.objects.all()
+        )
+
+        self.assertEqual(1, str(filterset.qs.query).count(' IN '))
+        self.assertEqual(3, filterset.qs.count())
+
+    def test_filter_by_non_valid_choice_returns_full_queryset(self):
+        result = self.filter(self.ExplicitFilterSet, 'enumeration=first,invalid')
+
+        self.assertEqual(set(CharTestEnum), result)
+
+    def test_implicit_in_lookup_uses_multiple_enum_choice_filter(self):
+        filterset = self.ImplicitFilterSet()
+
+        self.assertIsInstance(filterset.filters['enumeration__in'], MultipleEnumChoiceFilter)
+        self.assertIsInstance(filterset.filters['enumeration'], EnumChoiceFilter)
+
+    def test_implicit_in_lookup_filters_correctly(self):
+        result = self.filter(self.ImplicitFilterSet, 'enumeration__in=second,third')
+
+        self.assertEqual({CharTestEnum.SECOND, CharTestEnum.THIRD}, result)
+
+
 class FilterSetDRFIntegrationTests(TestCase):
     class ExplicitFilterSet(drf_filters.FilterSet):
         enumeration = EnumChoiceFilter(CharTestEnum)
@@ -1,6 +1,6 @@
 from django.test import TestCase
 
-from django_enum_choices.forms import EnumChoiceField
+from django_enum_choices.forms import EnumChoiceField, MultipleEnumChoiceField
 
 from .testapp.enumerations import CharTestEnum
 
@@ -30,3 +30,26 @@ class FormFieldTests(TestCase):
              ('Custom_second', 'second'),
              ('Custom_third', 'third')]
         )
+
+
+class MultipleFormFieldTests(TestCase):
+    def test_to_python_splits_delimited_values(self):
+        instance = MultipleEnumChoiceField(CharTestEnum, delimiter=',')
+
+        result = instance.to_python(['first, second', 'third', ''])
+
+        self.assertEqual([CharTestEnum.FIRST, CharTestEnum.SECOND, CharTestEnum.THIRD], result)
+
+    def test_to_python_splits_delimited_string(self):
+        instance = MultipleEnumChoiceField(CharTestEnum, delimiter=',')
+
+        result = instance.to_python('first,third')
+
+        self.assertEqual([CharTestEnum.FIRST, CharTestEnum.THIRD], result)
+
+    def test_to_python_does_not_split_values_without_delimiter(self):
+        instance = MultipleEnumChoiceField(CharTestEnum)
+
+        result = instance.to_python(['first,third'])
+
+        self.assertEqual(['first,third'], result)
@@ -1,10 +1,10 @@
 from django.test import TestCase
 from django import forms
 
-from django_enum_choices.forms import EnumChoiceField
+from django_enum_choices.forms import EnumChoiceField, MultipleEnumChoiceField
 
 from .testapp.enumerations import CharTestEnum
-from .testapp.models import StringEnumeratedModel, CustomChoiceBuilderEnumeratedModel
+from .testapp.models import StringEnumeratedModel, CustomChoiceBuilderEnumeratedModel, EnumSetModel
 
 
 def custom_choice_builder(choice):
@@ -151,3 +151,59 @@ class ModelFormIntegrationTests(TestCase):
             CharTestEnum.FIRST,
             instance.enumeration
         )
+
+
+class MultipleEnumChoiceFieldFormIntegrationTests(TestCase):
+    class MultipleEnumForm(forms.Form):
+        enumerated_field = MultipleEnumChoiceField(CharTestEnum)
+
+    class EnumSetModelForm(forms.ModelForm):
+        class Meta:
+            model = EnumSetModel
+            fields = ('enumeration', )
+
+    def test_values_are_cleaned_successfully_when_values_are_valid(self):
+        form = self.MultipleEnumForm({
+            'enumerated_field': ['first', 'third']
+        })
+
+        self.assertTrue(form.is_valid())
+        self.assertEqual(
+            [CharTestEnum.FIRST, CharTestEnum.THIRD],
+            form.cleaned_data['enumerated_field']
+        )
+
+    def test_form_is_not_valid_when_a_value_is_not_in_enum_class(self):
+        form = self.MultipleEnumForm({
+            'enumerated_field': ['first', 'not_valid']
+        })
+
+        self.assertFalse(form.is_valid())
+
+    def test_initial_value_is_rendered_with_built_values(self):
+        form = self.MultipleEnumForm(initial={'enumerated_field': [CharTestEnum.SECOND]})
+
+        self.assertIn('<option value="second" selected>', str(form['enumerated_field']))
+
+    def test_saving_model_form_creates_instance(self):
+        form = self.EnumSetModelForm({
+            'enumeration': ['first', 'second']
+        })
+
+        self.assertTrue(form.is_valid())
+
+        instance = form.save()
+        instance.refresh_from_db()
+
+        self.assertEqual(
+            frozenset([CharTestEnum.FIRST, CharTestEnum.SECOND]),
+            instance.enumeration
+        )
+
+    def test_form_has_not_changed_when_data_matches_initial(self):
+        form = self.MultipleEnumForm(
+            {'enumerated_field': ['first']},
+            initial={'enumerated_field': frozenset([CharTestEnum.FIRST])}
+        )
+
+        self.assertFalse(form.has_changed())
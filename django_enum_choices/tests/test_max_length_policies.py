@@ -0,0 +1,102 @@
+from django.test import TestCase
+from django.db import connection
+
+from django_enum_choices.fields import EnumChoiceField
+from django_enum_choices.exceptions import EnumChoiceFieldException
+from django_enum_choices.max_length_policies import (
+    ExactMaxLength,
+    MinimumMaxLength,
+    BucketedMaxLength,
+    UnboundedMaxLength
+)
+
+from .testapp.enumerations import CharTestEnum, CharLongValuesTestEnum
+
+
+class MaxLengthPolicyTests(TestCase):
+    def test_exact_max_length_returns_longest(self):
+        self.assertEqual(6, ExactMaxLength().get_max_length(6))
+
+    def test_minimum_max_length_returns_at_least_minimum(self):
+        policy = MinimumMaxLength(32)
+
+        self.assertEqual(32, policy.get_max_length(6))
+        self.assertEqual(40, policy.get_max_length(40))
+
+    def test_bucketed_max_length_rounds_up_to_bucket_size(self):
+        policy = BucketedMaxLength(size=16)
+
+        self.assertEqual(16, policy.get_max_length(1))
+        self.assertEqual(16, policy.get_max_length(16))
+        self.assertEqual(32, policy.get_max_length(17))
+        self.assertEqual(64, BucketedMaxLength(size=16, minimum=64).get_max_length(17))
+
+    def test_unbounded_max_length_returns_none(self):
+        self.assertIsNone(UnboundedMaxLength().get_max_length(6))
+
+    def test_policies_raise_exception_when_sizes_are_not_positive(self):
+        with self.assertRaisesMessage(EnumChoiceFieldException, '`size` must be a positive integer.'):
+            BucketedMaxLength(size=0)
+
+        with self.assertRaisesMessage(EnumChoiceFieldException, '`minimum` must be a positive integer.'):
+            MinimumMaxLength(0)
+
+    def test_policies_are_compared_by_arguments(self):
+        self.assertEqual(BucketedMaxLength(size=8), BucketedMaxLength(size=8))
+        self.assertNotEqual(BucketedMaxLength(size=8), BucketedMaxLength(size=16))
+        self.assertNotEqual(MinimumMaxLength(8), BucketedMaxLength(size=8, minimum=8))
+
+
+class EnumChoiceFieldMaxLengthPolicyTests(TestCase):
+    def test_field_uses_policy_for_max_length(self):
+        instance = EnumChoiceField(
+            enum_class=CharLongValuesTestEnum,
+            max_length_policy=BucketedMaxLength(size=8)
+        )
+
+        self.assertEqual(16, instance.max_length)
+        self.assertEqual([], instance._check_max_length_attribute())
+
+    def test_adding_longer_value_inside_bucket_keeps_max_length(self):
+        policy = BucketedMaxLength(size=16)
+
+        before = EnumChoiceField(enum_class=CharTestEnum, max_length_policy=policy)
+        after = EnumChoiceField(enum_class=CharLongValuesTestEnum, max_length_policy=policy)
+
+        self.assertEqual(before.max_length, after.max_length)
+
+    def test_passed_max_length_takes_precedence(self):
+        instance = EnumChoiceField(
+            enum_class=CharTestEnum,
+            max_length=10,
+            max_length_policy=MinimumMaxLength(32)
+        )
+
+        self.assertEqual(10, instance.max_length)
+
+    def test_unbounded_field_is_stored_as_text(self):
+        instance = EnumChoiceField(enum_class=CharTestEnum, max_length_policy=UnboundedMaxLength())
+
+        self.assertIsNone(instance.max_length)
+        self.assertEqual('TextField', instance.get_internal_type())
+        self.assertEqual('text', instance.db_type(connection))
+        self.assertEqual([], instance._check_max_length_attribute())
+        self.assertEqual(CharTestEnum.SECOND, instance.clean(CharTestEnum.SECOND, None))
+
+    def test_deconstruct_keeps_policy(self):
+        instance = EnumChoiceField(enum_class=CharTestEnum, max_length_policy=UnboundedMaxLength())
+        name, path, args, kwargs = instance.deconstruct()
+
+        new_instance = EnumChoiceField(*args, **kwargs)
+
+        self.assertNotIn('max_length', kwargs)
+        self.assertEqual(UnboundedMaxLength(), kwargs['max_length_policy'])
+        self.assertIsNone(new_instance.max_length)
+        self.assertEqual(
+            (
+                'django_enum_choices.max_length_policies.BucketedMaxLength',
+                (),
+                {'size': 8}
+            ),
+            BucketedMaxLength(size=8).deconstruct()
+        )
@@ -1,13 +1,23 @@
 from enum import Enum
+from unittest import mock
 
 from django.test import TestCase
+from django.db.models import AutoField, Field
+from django.db.migrations.autodetector import MigrationAutodetector
+from django.db.migrations.operations import AlterField
+from django.db.migrations.state import ModelState, ProjectState
+from django.db import connection
 from django.core.exceptions import ValidationError
 from django.contrib.admin.utils import display_for_field
 
-from django_enum_choices.fields import EnumChoiceField
+from django_enum_choices.fields import EnumChoiceField, EnumSetField
 from django_enum_choices.exceptions import EnumChoiceFieldException
+from django_enum_choices.validators import EnumValueMaxLengthValidator
 from django_enum_choices.choice_builders import value_value
-from django_enum_choices.forms import EnumChoiceField as EnumChoiceFormField
+from django_enum_choices.forms import (
+    EnumChoiceField as EnumChoiceFormField,
+    MultipleEnumChoiceField as MultipleEnumChoiceFormField
+)
 
 from .testapp.enumerations import CharTestEnum, IntTestEnum
 
@@ -105,6 +115,36 @@ class EnumChoiceFieldTests(TestCase):
 
         self.assertEqual(result, 'first')
 
+    def test_get_db_prep_value_returns_primitive_value(self):
+        instance = EnumChoiceField(enum_class=IntTestEnum)
+
+        self.assertEqual('2', instance.get_db_prep_value(IntTestEnum.SECOND, connection))
+        self.assertEqual('2', instance.get_db_prep_save(IntTestEnum.SECOND, connection))
+        self.assertIsNone(instance.get_db_prep_value(None, connection))
+
+    def test_lazy_field_has_no_db_converters(self):
+        instance = EnumChoiceField(enum_class=CharTestEnum, lazy=True)
+
+        self.assertEqual([], instance.get_db_converters(connection))
+        self.assertTrue(instance.deconstruct()[3]['lazy'])
+
+    def test_get_db_prep_value_respects_get_prep_value_in_subclasses(self):
+        class UpperEnumChoiceField(EnumChoiceField):
+            def get_prep_value(self, value):
+                return super().get_prep_value(value).upper()
+
+        instance = UpperEnumChoiceField(enum_class=CharTestEnum)
+
+        self.assertEqual('FIRST', instance.get_db_prep_value(CharTestEnum.FIRST, connection))
+        self.assertEqual(['FIRST'], instance.get_prep_values([CharTestEnum.FIRST]))
+
+    def test_get_prep_values_returns_primitive_values(self):
+        instance = EnumChoiceField(enum_class=CharTestEnum, null=True)
+
+        result = instance.get_prep_values([CharTestEnum.THIRD, None, CharTestEnum.FIRST])
+
+        self.assertEqual(['third', None, 'first'], result)
+
     def test_from_db_value_returns_none_when_value_is_none(self):
         instance = EnumChoiceField(enum_class=IntTestEnum)
 
@@ -132,6 +172,28 @@ class EnumChoiceFieldTests(TestCase):
         with self.assertRaises(ValidationError):
             instance.from_db_value(7, None, None)
 
+    def test_get_db_converters_returns_a_single_converter(self):
+        instance = EnumChoiceField(enum_class=CharTestEnum)
+
+        converters = instance.get_db_converters(None)
+
+        self.assertEqual(1, len(converters))
+        self.assertIs(converters[0], instance.get_db_converters(None)[0])
+
+    def test_db_converter_returns_enum_value(self):
+        instance = EnumChoiceField(enum_class=IntTestEnum)
+        converter, = instance.get_db_converters(None)
+
+        self.assertEqual(IntTestEnum.FIRST, converter('1', None, None))
+        self.assertIsNone(converter(None, None, None))
+
+    def test_db_converter_raises_exception_when_value_not_contained_in_enum_class(self):
+        instance = EnumChoiceField(enum_class=IntTestEnum)
+        converter, = instance.get_db_converters(None)
+
+        with self.assertRaises(ValidationError):
+            converter('7', None, None)
+
     def test_deconstruct_behaves_as_expected(self):
         """
         Idea taken from:
@@ -234,6 +296,15 @@ class EnumChoiceFieldTests(TestCase):
                 readable
             )
 
+    def test_flatchoices_are_built_once(self):
+        instance = EnumChoiceField(enum_class=CharTestEnum)
+
+        self.assertIs(instance.flatchoices, instance.flatchoices)
+        self.assertEqual(
+            [(CharTestEnum.FIRST, 'first'), (CharTestEnum.SECOND, 'second'), (CharTestEnum.THIRD, 'third')],
+            instance.flatchoices
+        )
+
     def test_display_for_field_returns_readable_value_when_autogenerated(self):
         instance = EnumChoiceField(enum_class=CharTestEnum)
 
@@ -354,3 +425,526 @@ class EnumChoiceFieldTests(TestCase):
         result = instance.formfield()
 
         self.assertIsInstance(result, EnumChoiceFormField)
+
+    def test_formfield_choices_are_built_once(self):
+        instance = EnumChoiceField(enum_class=CharTestEnum)
+
+        with mock.patch.object(instance, 'get_choices', wraps=instance.get_choices) as get_choices:
+            first = instance.formfield()
+            second = instance.formfield()
+            with_initial = instance.formfield(initial=CharTestEnum.FIRST)
+
+        self.assertEqual(2, get_choices.call_count)
+        self.assertEqual(first.choices, second.choices)
+        self.assertEqual([('', '---------')] + instance.choices, first.choices)
+        self.assertEqual(instance.choices, with_initial.choices)
+
+    def test_formfield_choices_are_not_shared_between_form_fields(self):
+        instance = EnumChoiceField(enum_class=CharTestEnum)
+
+        first = instance.formfield()
+        first.choices.append(('fourth', 'fourth'))
+
+        self.assertNotIn(('fourth', 'fourth'), instance.formfield().choices)
+
+
+class ReferencedChoicesEnumChoiceFieldTests(TestCase):
+    def test_deconstruct_omits_choices(self):
+        instance = EnumChoiceField(enum_class=CharTestEnum, inline_choices=False)
+        name, path, args, kwargs = instance.deconstruct()
+
+        self.assertNotIn('choices', kwargs)
+        self.assertFalse(kwargs['inline_choices'])
+        self.assertEqual(CharTestEnum, kwargs['enum_class'])
+
+    def test_field_rebuilds_choices_after_deconstruction(self):
+        instance = EnumChoiceField(enum_class=CharTestEnum, inline_choices=False)
+        name, path, args, kwargs = instance.deconstruct()
+
+        new_instance = EnumChoiceField(*args, **kwargs)
+
+        self.assertEqual(instance.choices, new_instance.choices)
+        self.assertEqual(instance.max_length, new_instance.max_length)
+        self.assertEqual(kwargs, new_instance.deconstruct()[3])
+
+    def test_deconstruct_keeps_choices_by_default(self):
+        instance = EnumChoiceField(enum_class=CharTestEnum)
+        name, path, args, kwargs = instance.deconstruct()
+
+        self.assertIn('choices', kwargs)
+        self.assertNotIn('inline_choices', kwargs)
+
+    def get_changes(self, old_field, new_field):
+        def build_state(field):
+            state = ProjectState()
+            state.add_model(ModelState('testapp', 'Pony', [
+                ('id', AutoField(primary_key=True)),
+                ('enumeration', field)
+            ]))
+
+            return state
+
+        autodetector = MigrationAutodetector(build_state(old_field), build_state(new_field))
+
+        return autodetector._detect_changes()
+
+    def build_historical_field(self, **kwargs):
+        # A field, loaded from a migration that was generated
+        # before `CharTestEnum.THIRD` was added to the enumeration
+        FirstTwoEnum = Enum('FirstTwoEnum', [('FIRST', 'first'), ('SECOND', 'second')])
+
+        name, path, args, deconstructed = EnumChoiceField(enum_class=FirstTwoEnum, **kwargs).deconstruct()
+        deconstructed['enum_class'] = CharTestEnum
+
+        return EnumChoiceField(*args, **deconstructed)
+
+    def test_deconstruct_keeps_check_values_with_check_constraint(self):
+        instance = EnumChoiceField(enum_class=CharTestEnum, inline_choices=False, db_check_constraint=True)
+        name, path, args, kwargs = instance.deconstruct()
+
+        self.assertEqual(['first', 'second', 'third'], kwargs['check_values'])
+        self.assertEqual(kwargs, EnumChoiceField(*args, **kwargs).deconstruct()[3])
+
+    def test_check_constraint_change_is_detected_when_enumeration_changes(self):
+        old_field = self.build_historical_field(inline_choices=False, db_check_constraint=True)
+        new_field = EnumChoiceField(enum_class=CharTestEnum, inline_choices=False, db_check_constraint=True)
+
+        changes = self.get_changes(old_field, new_field)
+        operation, = changes['testapp'][0].operations
+
+        self.assertIsInstance(operation, AlterField)
+
+        old_field.set_attributes_from_name('enumeration')
+        operation.field.set_attributes_from_name('enumeration')
+
+        self.assertNotIn("'third'", old_field.db_check(connection))
+        self.assertIn("'third'", operation.field.db_check(connection))
+
+    def test_check_constraint_follows_enumeration_with_inline_choices(self):
+        old_field = self.build_historical_field(db_check_constraint=True)
+        new_field = EnumChoiceField(enum_class=CharTestEnum, db_check_constraint=True)
+
+        changes = self.get_changes(old_field, new_field)
+        operation, = changes['testapp'][0].operations
+
+        self.assertIsInstance(operation, AlterField)
+
+        old_field.set_attributes_from_name('enumeration')
+        operation.field.set_attributes_from_name('enumeration')
+
+        self.assertEqual('"enumeration" IN (\'first\', \'second\')', old_field.db_check(connection))
+        self.assertNotEqual(old_field.db_check(connection), operation.field.db_check(connection))
+
+    def test_no_changes_are_detected_when_enumeration_changes_without_check_constraint(self):
+        old_field = self.build_historical_field(inline_choices=False)
+        new_field = EnumChoiceField(enum_class=CharTestEnum, inline_choices=False)
+
+        self.assertEqual({}, self.get_changes(old_field, new_field))
+
+
+class LegacyValuesEnumChoiceFieldTests(TestCase):
+    legacy_values = {'one': CharTestEnum.FIRST, 'old_third': CharTestEnum.THIRD}
+
+    def test_legacy_values_are_decoded(self):
+        instance = EnumChoiceField(enum_class=CharTestEnum, legacy_values=self.legacy_values)
+
+        self.assertEqual(CharTestEnum.FIRST, instance.from_db_value('one', None, None))
+        self.assertEqual(CharTestEnum.THIRD, instance.to_python('old_third'))
+        self.assertEqual(CharTestEnum.SECOND, instance.to_python('second'))
+        self.assertEqual('first', instance.get_prep_value(CharTestEnum.FIRST))
+
+    def test_legacy_codes_are_decoded(self):
+        instance = EnumChoiceField(
+            enum_class=IntTestEnum,
+            codes=lambda member: member.value,
+            legacy_values={10: IntTestEnum.FIRST}
+        )
+
+        self.assertEqual(IntTestEnum.FIRST, instance.from_db_value(10, None, None))
+        self.assertEqual(IntTestEnum.FIRST, instance.to_python(10))
+        self.assertEqual([10], instance.get_legacy_db_values(1))
+
+    def test_max_length_fits_legacy_values(self):
+        instance = EnumChoiceField(enum_class=CharTestEnum, legacy_values=self.legacy_values)
+
+        self.assertEqual(9, instance.max_length)
+
+    def test_db_check_allows_legacy_values(self):
+        instance = EnumChoiceField(
+            enum_class=CharTestEnum,
+            legacy_values={'one': CharTestEnum.FIRST},
+            db_check_constraint=True
+        )
+        instance.set_attributes_from_name('enumeration')
+
+        self.assertEqual(
+            '"enumeration" IN (\'first\', \'second\', \'third\', \'one\')',
+            instance.db_check(connection)
+        )
+
+    def test_deconstruct_keeps_legacy_values(self):
+        instance = EnumChoiceField(enum_class=CharTestEnum, legacy_values=self.legacy_values)
+        name, path, args, kwargs = instance.deconstruct()
+
+        new_instance = EnumChoiceField(*args, **kwargs)
+
+        self.assertEqual(self.legacy_values, new_instance.legacy_values)
+
+    def test_field_raises_exception_when_legacy_value_is_not_mapped_to_a_member(self):
+        with self.assertRaisesMessage(
+            EnumChoiceFieldException,
+            "Legacy value 'one' must be mapped to a member of CharTestEnum."
+        ):
+            EnumChoiceField(enum_class=CharTestEnum, legacy_values={'one': 'first'})
+
+    def test_field_raises_exception_when_legacy_value_is_a_current_value(self):
+        with self.assertRaisesMessage(
+            EnumChoiceFieldException,
+            "Legacy value 'second' is a current value of CharTestEnum."
+        ):
+            EnumChoiceField(enum_class=CharTestEnum, legacy_values={'second': CharTestEnum.FIRST})
+
+
+class EnumChoiceFieldCleanTests(TestCase):
+    def test_clean_returns_enumeration(self):
+        instance = EnumChoiceField(enum_class=CharTestEnum)
+
+        self.assertEqual(CharTestEnum.FIRST, instance.clean(CharTestEnum.FIRST, None))
+        self.assertEqual(CharTestEnum.SECOND, instance.clean('second', None))
+
+    def test_clean_raises_same_errors_as_field_clean(self):
+        instance = EnumChoiceField(enum_class=CharTestEnum)
+
+        for value in ('fourth', None, ''):
+            with self.subTest(value=value):
+                with self.assertRaises(ValidationError) as expected:
+                    Field.clean(instance, value, None)
+
+                with self.assertRaises(ValidationError) as result:
+                    instance.clean(value, None)
+
+                self.assertEqual(expected.exception.messages, result.exception.messages)
+                self.assertEqual(
+                    [error.code for error in expected.exception.error_list],
+                    [error.code for error in result.exception.error_list]
+                )
+
+    def test_clean_skips_max_length_validator_when_all_values_fit(self):
+        instance = EnumChoiceField(enum_class=CharTestEnum)
+
+        with mock.patch.object(EnumValueMaxLengthValidator, '__call__') as validator:
+            instance.clean(CharTestEnum.SECOND, None)
+
+        validator.assert_not_called()
+
+    def test_clean_runs_max_length_validator_when_values_do_not_fit(self):
+        instance = EnumChoiceField(enum_class=CharTestEnum, max_length=5)
+
+        with self.assertRaises(ValidationError) as result:
+            instance.clean(CharTestEnum.SECOND, None)
+
+        self.assertEqual('max_length', result.exception.error_list[0].code)
+        self.assertEqual(CharTestEnum.FIRST, instance.clean(CharTestEnum.FIRST, None))
+
+    def test_clean_runs_other_validators(self):
+        def validate_not_third(value):
+            if value == CharTestEnum.THIRD:
+                raise ValidationError('Third is not allowed.', code='third')
+
+        instance = EnumChoiceField(enum_class=CharTestEnum, validators=[validate_not_third])
+
+        with self.assertRaisesMessage(ValidationError, 'Third is not allowed.'):
+            instance.clean(CharTestEnum.THIRD, None)
+
+
+class IntegerCodesEnumChoiceFieldTests(TestCase):
+    codes = {
+        CharTestEnum.FIRST: 1,
+        CharTestEnum.SECOND: 2,
+        CharTestEnum.THIRD: 3
+    }
+
+    def test_field_is_stored_as_small_integer(self):
+        instance = EnumChoiceField(enum_class=CharTestEnum, codes=self.codes)
+
+        self.assertEqual('SmallIntegerField', instance.get_internal_type())
+        self.assertIsNone(instance.max_length)
+        self.assertEqual([], instance._check_max_length_attribute())
+
+    def test_choices_are_built_from_choice_builder(self):
+        instance = EnumChoiceField(enum_class=CharTestEnum, codes=self.codes)
+
+        self.assertEqual(
+            [('first', 'first'), ('second', 'second'), ('third', 'third')],
+            instance.choices
+        )
+
+    def test_get_prep_value_returns_code(self):
+        instance = EnumChoiceField(enum_class=CharTestEnum, codes=self.codes)
+
+        self.assertEqual(2, instance.get_prep_value(CharTestEnum.SECOND))
+        self.assertIsNone(instance.get_prep_value(None))
+
+    def test_get_prep_values_returns_codes(self):
+        instance = EnumChoiceField(enum_class=CharTestEnum, codes=self.codes)
+
+        result = instance.get_prep_values([CharTestEnum.SECOND, CharTestEnum.FIRST, None])
+
+        self.assertEqual([2, 1, None], result)
+        self.assertEqual(3, instance.get_db_prep_value(CharTestEnum.THIRD, connection))
+
+    def test_from_db_value_returns_enum_value(self):
+        instance = EnumChoiceField(enum_class=CharTestEnum, codes=self.codes)
+
+        self.assertEqual(CharTestEnum.THIRD, instance.from_db_value(3, None, None))
+
+    def test_from_db_value_raises_exception_when_code_is_not_found(self):
+        instance = EnumChoiceField(enum_class=CharTestEnum, codes=self.codes)
+
+        with self.assertRaises(ValidationError):
+            instance.from_db_value(7, None, None)
+
+    def test_to_python_accepts_codes_and_built_values(self):
+        instance = EnumChoiceField(enum_class=CharTestEnum, codes=self.codes)
+
+        self.assertEqual(CharTestEnum.FIRST, instance.to_python(1))
+        self.assertEqual(CharTestEnum.FIRST, instance.to_python('first'))
+
+    def test_codes_can_be_built_with_a_callable(self):
+        instance = EnumChoiceField(enum_class=IntTestEnum, codes=lambda member: member.value * 10)
+
+        self.assertEqual(30, instance.get_prep_value(IntTestEnum.THIRD))
+
+    def test_field_raises_exception_when_code_is_missing(self):
+        with self.assertRaisesMessage(
+            EnumChoiceFieldException,
+            '`codes` is missing a code for CharTestEnum.THIRD.'
+        ):
+            EnumChoiceField(
+                enum_class=CharTestEnum,
+                codes={CharTestEnum.FIRST: 1, CharTestEnum.SECOND: 2}
+            )
+
+    def test_field_raises_exception_when_code_is_not_a_small_integer(self):
+        for code in ('3', 3.0, 40000):
+            with self.subTest(code=code):
+                with self.assertRaises(EnumChoiceFieldException):
+                    EnumChoiceField(
+                        enum_class=CharTestEnum,
+                        codes={**self.codes, CharTestEnum.THIRD: code}
+                    )
+
+    def test_field_raises_exception_when_codes_are_not_unique(self):
+        with self.assertRaisesMessage(
+            EnumChoiceFieldException,
+            'Codes for CharTestEnum must be unique.'
+        ):
+            EnumChoiceField(
+                enum_class=CharTestEnum,
+                codes={**self.codes, CharTestEnum.THIRD: 1}
+            )
+
+    def test_deconstruct_keeps_codes(self):
+        instance = EnumChoiceField(enum_class=CharTestEnum, codes=self.codes)
+        name, path, args, kwargs = instance.deconstruct()
+
+        new_instance = EnumChoiceField(*args, **kwargs)
+
+        self.assertEqual(self.codes, kwargs['codes'])
+        self.assertNotIn('max_length', kwargs)
+        self.assertEqual(instance.get_internal_type(), new_instance.get_internal_type())
+
+    def test_formfield_uses_built_values(self):
+        instance = EnumChoiceField(enum_class=CharTestEnum, codes=self.codes)
+
+        result = instance.formfield()
+
+        self.assertEqual(CharTestEnum.FIRST, result.clean('first'))
+
+
+class PostgresEnumTypeEnumChoiceFieldTests(TestCase):
+    def test_deconstruct_keeps_postgres_enum_type(self):
+        instance = EnumChoiceField(enum_class=CharTestEnum, postgres_enum_type='char_test_enum')
+        name, path, args, kwargs = instance.deconstruct()
+
+        new_instance = EnumChoiceField(*args, **kwargs)
+
+        self.assertEqual('char_test_enum', new_instance.postgres_enum_type)
+
+    def test_field_raises_exception_when_used_with_codes(self):
+        with self.assertRaisesMessage(
+            EnumChoiceFieldException,
+            '`codes` and `postgres_enum_type` can not be used together.'
+        ):
+            EnumChoiceField(
+                enum_class=IntTestEnum,
+                codes=lambda member: member.value,
+                postgres_enum_type='int_test_enum'
+            )
+
+
+class CheckConstraintEnumChoiceFieldTests(TestCase):
+    def test_db_check_returns_none_by_default(self):
+        instance = EnumChoiceField(enum_class=CharTestEnum)
+        instance.set_attributes_from_name('enumeration')
+
+        self.assertIsNone(instance.db_check(connection))
+
+    def test_db_check_restricts_column_to_stored_values(self):
+        instance = EnumChoiceField(enum_class=CharTestEnum, db_check_constraint=True)
+        instance.set_attributes_from_name('enumeration')
+
+        self.assertEqual(
+            '"enumeration" IN (\'first\', \'second\', \'third\')',
+            instance.db_check(connection)
+        )
+
+    def test_db_check_uses_codes(self):
+        instance = EnumChoiceField(
+            enum_class=IntTestEnum,
+            codes=lambda member: member.value * 10,
+            db_check_constraint=True
+        )
+        instance.set_attributes_from_name('enumeration')
+
+        self.assertEqual('"enumeration" IN (10, 20, 30)', instance.db_check(connection))
+
+    def test_db_check_escapes_quotes(self):
+        class QuotedEnum(Enum):
+            QUOTED = "it's"
+
+        instance = EnumChoiceField(enum_class=QuotedEnum, db_check_constraint=True)
+        instance.set_attributes_from_name('enumeration')
+
+        self.assertEqual('"enumeration" IN (\'it\'\'s\')', instance.db_check(connection))
+
+    def test_deconstruct_keeps_db_check_constraint(self):
+        instance = EnumChoiceField(enum_class=CharTestEnum, db_check_constraint=True)
+        name, path, args, kwargs = instance.deconstruct()
+
+        new_instance = EnumChoiceField(*args, **kwargs)
+
+        self.assertTrue(new_instance.db_check_constraint)
+        self.assertNotIn(
+            'db_check_constraint',
+            EnumChoiceField(enum_class=CharTestEnum).deconstruct()[3]
+        )
+
+
+class EnumSetFieldTests(TestCase):
+    def test_get_prep_value_returns_bitmask(self):
+        instance = EnumSetField(enum_class=CharTestEnum)
+
+        self.assertEqual(0b101, instance.get_prep_value({CharTestEnum.FIRST, CharTestEnum.THIRD}))
+        self.assertEqual(0b010, instance.get_prep_value(CharTestEnum.SECOND))
+        self.assertEqual(0, instance.get_prep_value(frozenset()))
+        self.assertIsNone(instance.get_prep_value(None))
+
+    def test_from_db_value_returns_frozenset(self):
+        instance = EnumSetField(enum_class=CharTestEnum)
+
+        result = instance.from_db_value(0b110, None, None)
+
+        self.assertEqual(frozenset([CharTestEnum.SECOND, CharTestEnum.THIRD]), result)
+        self.assertIsNone(instance.from_db_value(None, None, None))
+
+    def test_from_db_value_raises_exception_when_bit_is_not_in_enum_class(self):
+        instance = EnumSetField(enum_class=CharTestEnum)
+
+        with self.assertRaises(ValidationError):
+            instance.from_db_value(0b1000, None, None)
+
+    def test_to_python_accepts_enumerations_and_built_values(self):
+        instance = EnumSetField(enum_class=CharTestEnum)
+
+        result = instance.to_python([CharTestEnum.FIRST, 'second'])
+
+        self.assertEqual(frozenset([CharTestEnum.FIRST, CharTestEnum.SECOND]), result)
+
+    def test_to_python_raises_exception_when_value_is_not_in_enum_class(self):
+        instance = EnumSetField(enum_class=CharTestEnum)
+
+        with self.assertRaises(ValidationError):
+            instance.to_python(['foo'])
+
+    def test_to_python_accepts_serialized_values(self):
+        instance = EnumSetField(enum_class=CharTestEnum)
+
+        result = instance.to_python('["first", "third"]')
+
+        self.assertEqual(frozenset([CharTestEnum.FIRST, CharTestEnum.THIRD]), result)
+
+    def test_to_python_accepts_serialized_bitmask(self):
+        instance = EnumSetField(enum_class=CharTestEnum)
+
+        self.assertEqual(frozenset([CharTestEnum.SECOND]), instance.to_python('2'))
+
+    def test_to_python_raises_exception_when_string_is_not_serialized_list(self):
+        instance = EnumSetField(enum_class=CharTestEnum)
+
+        for value in ('first', 'null', '1.5', 'true', '"first"', '{"first": 1}'):
+            with self.subTest(value=value):
+                with self.assertRaises(ValidationError):
+                    instance.to_python(value)
+
+    def test_to_python_raises_exception_when_value_is_not_iterable(self):
+        instance = EnumSetField(enum_class=CharTestEnum)
+
+        for value in (1.5, {'first': 1}, object()):
+            with self.subTest(value=value):
+                with self.assertRaises(ValidationError):
+                    instance.to_python(value)
+
+    def test_bits_can_be_passed(self):
+        instance = EnumSetField(
+            enum_class=CharTestEnum,
+            bits={
+                CharTestEnum.FIRST: 2,
+                CharTestEnum.SECOND: 1,
+                CharTestEnum.THIRD: 0
+            }
+        )
+
+        self.assertEqual(0b100, instance.get_prep_value([CharTestEnum.FIRST]))
+
+    def test_field_raises_exception_when_enum_class_has_too_many_members(self):
+        TooLargeEnum = Enum('TooLargeEnum', ['MEMBER_{}'.format(i) for i in range(64)])
+
+        with self.assertRaises(EnumChoiceFieldException):
+            EnumSetField(enum_class=TooLargeEnum)
+
+    def test_field_raises_exception_when_bits_are_not_unique(self):
+        with self.assertRaisesMessage(
+            EnumChoiceFieldException,
+            'Bits for CharTestEnum must be unique.'
+        ):
+            EnumSetField(enum_class=CharTestEnum, bits=lambda member: 0)
+
+    def test_validate_raises_error_when_field_is_not_blank_and_value_is_empty(self):
+        instance = EnumSetField(enum_class=CharTestEnum)
+
+        with self.assertRaisesMessage(
+            ValidationError,
+            str(instance.error_messages['blank'])
+        ):
+            instance.validate(frozenset(), None)
+
+    def test_deconstruct_behaves_as_expected(self):
+        instance = EnumSetField(enum_class=IntTestEnum)
+        name, path, args, kwargs = instance.deconstruct()
+
+        new_instance = EnumSetField(*args, **kwargs)
+
+        self.assertEqual(instance.enum_class, new_instance.enum_class)
+        self.assertEqual(instance._original_choice_builder, new_instance._original_choice_builder)
+
+    def test_formfield_returns_multiple_enum_choice_form_field_instance(self):
+        instance = EnumSetField(enum_class=CharTestEnum)
+
+        result = instance.formfield()
+
+        self.assertIsInstance(result, MultipleEnumChoiceFormField)
+        self.assertEqual(
+            [CharTestEnum.FIRST, CharTestEnum.THIRD],
+            result.clean(['first', 'third'])
+        )
@@ -1,6 +1,8 @@
 from django.test import TestCase
+from django.db import IntegrityError, connection, connections, transaction
 from django.core import serializers
 from django.core.exceptions import ValidationError
+from django.test.utils import CaptureQueriesContext
 
 from django_enum_choices.fields import EnumChoiceField
 
@@ -11,7 +13,14 @@ from .testapp.models import (
     NullableEnumeratedModel,
     BlankNullableEnumeratedModel,
     EnumChoiceFieldWithDefaultModel,
-    AttributeChoiceBuilderEnumeratedModel
+    AttributeChoiceBuilderEnumeratedModel,
+    IntegerCodesEnumeratedModel,
+    ValueCodeEnumeratedModel,
+    CheckConstraintEnumeratedModel,
+    LazyEnumeratedModel,
+    CustomDisplayEnumeratedModel,
+    LegacyValuesEnumeratedModel,
+    EnumSetModel
 )
 
 
@@ -90,6 +99,21 @@ class ModelIntegrationTests(TestCase):
         self.assertIn(second, second_qs)
         self.assertNotIn(first, second_qs)
 
+    def test_values_list_returns_enumerations(self):
+        StringEnumeratedModel.objects.create(enumeration=CharTestEnum.FIRST)
+        StringEnumeratedModel.objects.create(enumeration=CharTestEnum.SECOND)
+
+        result = StringEnumeratedModel.objects.order_by('id').values_list('enumeration', flat=True)
+
+        self.assertEqual([CharTestEnum.FIRST, CharTestEnum.SECOND], list(result))
+
+    def test_values_returns_enumerations(self):
+        IntegerEnumeratedModel.objects.create(enumeration=IntTestEnum.THIRD)
+
+        result = IntegerEnumeratedModel.objects.values('enumeration').get()
+
+        self.assertEqual({'enumeration': IntTestEnum.THIRD}, result)
+
     def test_serialization(self):
         IntegerEnumeratedModel.objects.create(
             enumeration=IntTestEnum.FIRST
@@ -180,3 +204,369 @@ class ModelIntegrationTests(TestCase):
             EnumChoiceFieldWithDefaultModel._meta.get_field('enumeration').default,
             instance.enumeration
         )
+
+
+class IntegerCodesModelIntegrationTests(TestCase):
+    def test_can_create_object(self):
+        instance = IntegerCodesEnumeratedModel.objects.create(
+            enumeration=CharTestEnum.SECOND
+        )
+        instance.refresh_from_db()
+
+        self.assertEqual(instance.enumeration, CharTestEnum.SECOND)
+
+    def test_code_is_stored_in_the_database(self):
+        IntegerCodesEnumeratedModel.objects.create(enumeration=CharTestEnum.SECOND)
+        ValueCodeEnumeratedModel.objects.create(enumeration=IntTestEnum.THIRD)
+
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT enumeration FROM testapp_integercodesenumeratedmodel')
+            stored_code, = cursor.fetchone()
+
+            cursor.execute('SELECT enumeration FROM testapp_valuecodeenumeratedmodel')
+            stored_value_code, = cursor.fetchone()
+
+        self.assertEqual(20, stored_code)
+        self.assertEqual(3, stored_value_code)
+
+    def test_can_filter_by_enumeration(self):
+        first = IntegerCodesEnumeratedModel.objects.create(enumeration=CharTestEnum.FIRST)
+        second = IntegerCodesEnumeratedModel.objects.create(enumeration=CharTestEnum.SECOND)
+
+        result = IntegerCodesEnumeratedModel.objects.filter(
+            enumeration__in=[CharTestEnum.FIRST, CharTestEnum.THIRD]
+        )
+
+        self.assertIn(first, result)
+        self.assertNotIn(second, result)
+
+    def test_nullable_field_can_be_set_to_none(self):
+        instance = ValueCodeEnumeratedModel.objects.create(enumeration=None)
+        instance.refresh_from_db()
+
+        self.assertIsNone(instance.enumeration)
+
+    def test_full_clean_does_not_raise_error(self):
+        instance = IntegerCodesEnumeratedModel(enumeration=CharTestEnum.FIRST)
+
+        instance.full_clean()
+
+    def test_serialization_uses_built_values(self):
+        IntegerCodesEnumeratedModel.objects.create(enumeration=CharTestEnum.FIRST)
+
+        data = serializers.serialize('json', IntegerCodesEnumeratedModel.objects.all())
+        deserialized, = serializers.deserialize('json', data)
+
+        self.assertIn('"enumeration": "first"', data)
+        self.assertEqual(CharTestEnum.FIRST, deserialized.object.enumeration)
+
+
+class EnumChoiceLookupTests(TestCase):
+    databases = ['default', 'postgresql']
+
+    def create_instances(self, using):
+        return [
+            StringEnumeratedModel.objects.using(using).create(enumeration=member)
+            for member in CharTestEnum
+        ]
+
+    def test_in_lookup_filters_by_enumerations(self):
+        for using in ('default', 'postgresql'):
+            with self.subTest(using=using):
+                first, second, third = self.create_instances(using)
+
+                result = StringEnumeratedModel.objects.using(using).filter(
+                    enumeration__in=[CharTestEnum.FIRST, CharTestEnum.THIRD, CharTestEnum.FIRST, None]
+                ).order_by('pk')
+
+                self.assertEqual([first, third], list(result))
+
+    def test_in_lookup_removes_duplicates(self):
+        queryset = StringEnumeratedModel.objects.filter(
+            enumeration__in=[CharTestEnum.FIRST, CharTestEnum.FIRST, CharTestEnum.SECOND]
+        )
+
+        lookup, = queryset.query.where.children
+
+        self.assertEqual(['first', 'second'], lookup.rhs)
+
+    def test_in_lookup_uses_a_single_array_parameter_on_postgresql(self):
+        self.create_instances('postgresql')
+
+        for values in ([CharTestEnum.FIRST], [CharTestEnum.FIRST, CharTestEnum.SECOND]):
+            with CaptureQueriesContext(connections['postgresql']) as context:
+                count = StringEnumeratedModel.objects.using('postgresql').filter(
+                    enumeration__in=values
+                ).count()
+
+            self.assertEqual(len(values), count)
+            self.assertIn('= ANY(', context.captured_queries[0]['sql'])
+
+    def test_in_lookup_returns_no_results_when_empty(self):
+        for using in ('default', 'postgresql'):
+            with self.subTest(using=using):
+                self.create_instances(using)
+
+                with self.assertNumQueries(0, using=using):
+                    result = list(
+                        StringEnumeratedModel.objects.using(using).filter(enumeration__in=[None])
+                    )
+
+                self.assertEqual([], result)
+
+    def test_in_lookup_accepts_subqueries(self):
+        for using in ('default', 'postgresql'):
+            with self.subTest(using=using):
+                first, second, third = self.create_instances(using)
+
+                subquery = StringEnumeratedModel.objects.using(using).filter(
+                    pk=second.pk
+                ).values('enumeration')
+                result = StringEnumeratedModel.objects.using(using).filter(enumeration__in=subquery)
+
+                self.assertEqual([second], list(result))
+
+    def test_exact_lookup_filters_by_enumeration(self):
+        for using in ('default', 'postgresql'):
+            with self.subTest(using=using):
+                first, second, third = self.create_instances(using)
+
+                result = StringEnumeratedModel.objects.using(using).filter(enumeration=CharTestEnum.SECOND)
+
+                self.assertEqual([second], list(result))
+
+    def test_lookups_use_codes(self):
+        first = IntegerCodesEnumeratedModel.objects.create(enumeration=CharTestEnum.FIRST)
+        IntegerCodesEnumeratedModel.objects.create(enumeration=CharTestEnum.SECOND)
+
+        self.assertEqual(
+            [first],
+            list(IntegerCodesEnumeratedModel.objects.filter(enumeration=CharTestEnum.FIRST))
+        )
+        self.assertEqual(
+            [first],
+            list(IntegerCodesEnumeratedModel.objects.filter(enumeration__in=[CharTestEnum.FIRST]))
+        )
+
+
+class DisplayModelIntegrationTests(TestCase):
+    def test_display_returns_label(self):
+        instance = AttributeChoiceBuilderEnumeratedModel(enumeration=CharLongValuesTestEnum.SECOND)
+
+        self.assertEqual('second value', instance.get_enumeration_display())
+
+    def test_display_returns_value_when_it_is_not_an_enumeration(self):
+        self.assertIsNone(NullableEnumeratedModel(enumeration=None).get_enumeration_display())
+        self.assertEqual('foo', StringEnumeratedModel(enumeration='foo').get_enumeration_display())
+        self.assertEqual("['foo']", StringEnumeratedModel(enumeration=['foo']).get_enumeration_display())
+
+    def test_display_uses_labels_with_codes_and_lazy_fields(self):
+        IntegerCodesEnumeratedModel.objects.create(enumeration=CharTestEnum.THIRD)
+        LazyEnumeratedModel.objects.create(enumeration=CharTestEnum.FIRST)
+
+        self.assertEqual('third', IntegerCodesEnumeratedModel.objects.get().get_enumeration_display())
+        self.assertEqual('first', LazyEnumeratedModel.objects.get().get_enumeration_display())
+
+    def test_display_method_defined_on_the_model_is_kept(self):
+        instance = CustomDisplayEnumeratedModel(enumeration=CharTestEnum.FIRST)
+
+        self.assertEqual('Custom first', instance.get_enumeration_display())
+
+
+class LazyModelIntegrationTests(TestCase):
+    def test_stored_value_is_decoded_on_first_access(self):
+        LazyEnumeratedModel.objects.create(enumeration=CharTestEnum.SECOND)
+
+        instance = LazyEnumeratedModel.objects.get()
+
+        self.assertEqual('second', instance.__dict__['enumeration'])
+        self.assertEqual(CharTestEnum.SECOND, instance.enumeration)
+        self.assertEqual(CharTestEnum.SECOND, instance.__dict__['enumeration'])
+
+    def test_assigned_values_are_returned(self):
+        instance = LazyEnumeratedModel(enumeration=CharTestEnum.FIRST)
+
+        self.assertEqual(CharTestEnum.FIRST, instance.enumeration)
+
+        instance.enumeration = None
+
+        self.assertIsNone(instance.enumeration)
+
+        instance.enumeration = 'fourth'
+
+        self.assertEqual('fourth', instance.enumeration)
+
+    def test_instance_can_be_saved_and_filtered(self):
+        instance = LazyEnumeratedModel.objects.create(enumeration=CharTestEnum.FIRST)
+
+        instance = LazyEnumeratedModel.objects.get(enumeration=CharTestEnum.FIRST)
+        instance.enumeration = CharTestEnum.THIRD
+        instance.save()
+        instance.refresh_from_db()
+
+        self.assertEqual(CharTestEnum.THIRD, instance.enumeration)
+
+    def test_deferred_field_is_loaded_on_access(self):
+        LazyEnumeratedModel.objects.create(enumeration=CharTestEnum.THIRD)
+
+        instance = LazyEnumeratedModel.objects.defer('enumeration').get()
+
+        self.assertEqual({'enumeration'}, instance.get_deferred_fields())
+
+        with self.assertNumQueries(1):
+            self.assertEqual(CharTestEnum.THIRD, instance.enumeration)
+
+    def test_values_list_returns_stored_values(self):
+        LazyEnumeratedModel.objects.create(enumeration=CharTestEnum.FIRST)
+
+        result = LazyEnumeratedModel.objects.values_list('enumeration', flat=True)
+
+        self.assertEqual(['first'], list(result))
+
+    def test_full_clean_does_not_raise_error(self):
+        LazyEnumeratedModel.objects.create(enumeration=CharTestEnum.FIRST)
+
+        LazyEnumeratedModel.objects.get().full_clean()
+
+
+class LegacyValuesModelIntegrationTests(TestCase):
+    databases = ['default', 'postgresql']
+
+    def insert_values(self, values, using):
+        with connections[using].cursor() as cursor:
+            for value in values:
+                cursor.execute(
+                    'INSERT INTO testapp_legacyvaluesenumeratedmodel (enumeration) VALUES (%s)',
+                    [value]
+                )
+
+    def test_legacy_values_are_decoded(self):
+        for using in ('default', 'postgresql'):
+            with self.subTest(using=using):
+                self.insert_values(['one', 'second', 'old_third'], using)
+
+                result = LegacyValuesEnumeratedModel.objects.using(using).order_by('pk')
+
+                self.assertEqual(
+                    [CharTestEnum.FIRST, CharTestEnum.SECOND, CharTestEnum.THIRD],
+                    [instance.enumeration for instance in result]
+                )
+
+    def test_lookups_match_legacy_values(self):
+        for using in ('default', 'postgresql'):
+            with self.subTest(using=using):
+                self.insert_values(['one', 'first', 'second', 'old_third'], using)
+
+                queryset = LegacyValuesEnumeratedModel.objects.using(using)
+
+                self.assertEqual(2, queryset.filter(enumeration=CharTestEnum.FIRST).count())
+                self.assertEqual(2, queryset.exclude(enumeration=CharTestEnum.FIRST).count())
+                self.assertEqual(
+                    3,
+                    queryset.filter(enumeration__in=[CharTestEnum.FIRST, CharTestEnum.THIRD]).count()
+                )
+
+    def test_current_value_is_written(self):
+        self.insert_values(['one'], 'default')
+
+        instance = LegacyValuesEnumeratedModel.objects.get()
+        instance.save()
+
+        self.assertEqual(
+            ['first'],
+            list(LegacyValuesEnumeratedModel.objects.values_list('enumeration__raw', flat=True))
+        )
+
+
+class CheckConstraintModelIntegrationTests(TestCase):
+    databases = ['default', 'postgresql']
+
+    def test_database_accepts_stored_values(self):
+        for using in ('default', 'postgresql'):
+            with self.subTest(using=using):
+                instance = CheckConstraintEnumeratedModel.objects.using(using).create(
+                    enumeration=CharTestEnum.SECOND
+                )
+                instance.refresh_from_db()
+
+                self.assertEqual(CharTestEnum.SECOND, instance.enumeration)
+
+    def test_database_rejects_values_outside_of_the_enum_class(self):
+        for using in ('default', 'postgresql'):
+            with self.subTest(using=using):
+                with self.assertRaises(IntegrityError), transaction.atomic(using=using):
+                    with connections[using].cursor() as cursor:
+                        cursor.execute(
+                            'INSERT INTO testapp_checkconstraintenumeratedmodel (enumeration) VALUES (%s)',
+                            ['fourth']
+                        )
+
+
+class EnumSetFieldModelIntegrationTests(TestCase):
+    databases = ['default', 'postgresql']
+
+    def test_can_create_object(self):
+        instance = EnumSetModel.objects.create(
+            enumeration={CharTestEnum.FIRST, CharTestEnum.THIRD}
+        )
+        instance.refresh_from_db()
+
+        self.assertEqual(frozenset([CharTestEnum.FIRST, CharTestEnum.THIRD]), instance.enumeration)
+
+    def test_default_is_empty_set(self):
+        instance = EnumSetModel.objects.create()
+        instance.refresh_from_db()
+
+        self.assertEqual(frozenset(), instance.enumeration)
+
+    def test_lookups_use_bitwise_operations(self):
+        for using in ('default', 'postgresql'):
+            with self.subTest(using=using):
+                queryset = EnumSetModel.objects.using(using)
+
+                first = queryset.create(enumeration={CharTestEnum.FIRST})
+                first_and_second = queryset.create(enumeration={CharTestEnum.FIRST, CharTestEnum.SECOND})
+                third = queryset.create(enumeration={CharTestEnum.THIRD})
+                empty = queryset.create(enumeration=frozenset())
+
+                def filtered(**kwargs):
+                    return set(queryset.filter(**kwargs))
+
+                self.assertEqual(
+                    {first, first_and_second},
+                    filtered(enumeration__has_any=[CharTestEnum.FIRST, CharTestEnum.SECOND])
+                )
+                self.assertEqual(
+                    {first_and_second},
+                    filtered(enumeration__has_all=[CharTestEnum.FIRST, CharTestEnum.SECOND])
+                )
+                self.assertEqual(
+                    {third, empty},
+                    filtered(enumeration__has_none=[CharTestEnum.FIRST, CharTestEnum.SECOND])
+                )
+                self.assertEqual(
+                    {third},
+                    filtered(enumeration__has_any=CharTestEnum.THIRD)
+                )
+                self.assertEqual(
+                    {first_and_second},
+                    filtered(enumeration={CharTestEnum.SECOND, CharTestEnum.FIRST})
+                )
+
+    def test_serialization(self):
+        EnumSetModel.objects.create(enumeration={CharTestEnum.THIRD, CharTestEnum.FIRST})
+
+        data = serializers.serialize('json', EnumSetModel.objects.all())
+        deserialized, = serializers.deserialize('json', data)
+
+        self.assertIn('"enumeration": "[\\"first\\", \\"third\\"]"', data)
+        self.assertEqual(
+            frozenset([CharTestEnum.FIRST, CharTestEnum.THIRD]),
+            deserialized.object.enumeration
+        )
+
+    def test_full_clean_raises_validation_error_when_value_is_not_serialized_list(self):
+        instance = EnumSetModel(enumeration='first')
+
+        with self.assertRaises(ValidationError):
+            instance.full_clean()
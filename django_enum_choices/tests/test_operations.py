@@ -0,0 +1,445 @@
+from django.test import TransactionTestCase
+from django.db import IntegrityError, connections, migrations, models, transaction
+from django.db.migrations.state import ProjectState
+
+from django_enum_choices.fields import EnumChoiceField
+from django_enum_choices.operations import (
+    AlterEnumChoiceFieldStorage,
+    AlterEnumChoiceFieldCheck,
+    CreatePostgresEnumType,
+    DropPostgresEnumType,
+    AddPostgresEnumValue,
+    RenamePostgresEnumValue,
+    RemapEnumValues,
+    RenameEnumValue
+)
+from django_enum_choices.utils import build_enum_values
+from django_enum_choices.choice_builders import value_value
+
+from .testapp.enumerations import CharTestEnum
+
+APP_LABEL = 'test_operations'
+
+
+class OperationTestCase(TransactionTestCase):
+    databases = ['default', 'postgresql']
+
+    def apply_operations(self, operations, state, using='default', backwards=False):
+        with connections[using].schema_editor() as schema_editor:
+            for operation in operations:
+                new_state = state.clone()
+                operation.state_forwards(APP_LABEL, new_state)
+
+                if backwards:
+                    operation.database_backwards(APP_LABEL, schema_editor, new_state, state)
+                else:
+                    operation.database_forwards(APP_LABEL, schema_editor, state, new_state)
+
+                state = new_state
+
+        return state
+
+    def create_model(self, field, using='default', fields=(), options=None):
+        operation = migrations.CreateModel(
+            'Pony',
+            [
+                ('id', models.AutoField(primary_key=True)),
+                ('enumeration', field)
+            ] + list(fields),
+            options=options or {}
+        )
+        state = self.apply_operations([operation], ProjectState(), using=using)
+
+        self.addCleanup(
+            self.apply_operations,
+            [migrations.DeleteModel('Pony')],
+            state,
+            using=using
+        )
+
+        return state
+
+    def fetch_values(self, state, using='default'):
+        model = state.apps.get_model(APP_LABEL, 'Pony')
+
+        return list(
+            model.objects.using(using).order_by('id').values_list('enumeration', flat=True)
+        )
+
+
+class AlterEnumChoiceFieldStorageTests(OperationTestCase):
+    codes = {
+        CharTestEnum.FIRST: 1,
+        CharTestEnum.SECOND: 2,
+        CharTestEnum.THIRD: 3
+    }
+
+    def test_values_are_converted_to_codes_and_back(self):
+        for using in ('default', 'postgresql'):
+            with self.subTest(using=using):
+                state = self.create_model(EnumChoiceField(CharTestEnum), using=using)
+
+                model = state.apps.get_model(APP_LABEL, 'Pony')
+                model.objects.using(using).create(enumeration=CharTestEnum.SECOND)
+                model.objects.using(using).create(enumeration=CharTestEnum.THIRD)
+
+                operation = AlterEnumChoiceFieldStorage(
+                    'Pony',
+                    'enumeration',
+                    EnumChoiceField(CharTestEnum, codes=self.codes)
+                )
+
+                new_state = self.apply_operations([operation], state, using=using)
+                new_field = new_state.apps.get_model(APP_LABEL, 'Pony')._meta.get_field('enumeration')
+
+                self.assertEqual('SmallIntegerField', new_field.get_internal_type())
+                self.assertEqual([CharTestEnum.SECOND, CharTestEnum.THIRD], self.fetch_values(new_state, using))
+
+                with connections[using].cursor() as cursor:
+                    cursor.execute('SELECT enumeration FROM test_operations_pony ORDER BY id')
+                    self.assertEqual([(2, ), (3, )], cursor.fetchall())
+
+                self.apply_operations([operation], state, using=using, backwards=True)
+
+                self.assertEqual([CharTestEnum.SECOND, CharTestEnum.THIRD], self.fetch_values(state, using))
+
+    def get_constraints(self, using):
+        connection = connections[using]
+
+        with connection.cursor() as cursor:
+            return connection.introspection.get_constraints(cursor, 'test_operations_pony')
+
+    def test_composite_indexes_and_constraints_are_kept(self):
+        for using in ('default', 'postgresql'):
+            with self.subTest(using=using):
+                state = self.create_model(
+                    EnumChoiceField(CharTestEnum, db_index=True, db_check_constraint=True),
+                    using=using,
+                    fields=[('number', models.IntegerField())],
+                    options={
+                        'indexes': [models.Index(fields=['enumeration', 'number'], name='pony_enumeration_number')],
+                        'unique_together': {('number', 'enumeration')}
+                    }
+                )
+
+                model = state.apps.get_model(APP_LABEL, 'Pony')
+                model.objects.using(using).create(enumeration=CharTestEnum.SECOND, number=1)
+
+                operation = AlterEnumChoiceFieldStorage(
+                    'Pony',
+                    'enumeration',
+                    EnumChoiceField(CharTestEnum, codes=self.codes, db_index=True, db_check_constraint=True)
+                )
+
+                new_state = self.apply_operations([operation], state, using=using)
+                constraints = self.get_constraints(using)
+
+                self.assertEqual(['enumeration', 'number'], constraints['pony_enumeration_number']['columns'])
+                self.assertTrue(any(
+                    constraint['unique'] and constraint['columns'] == ['number', 'enumeration']
+                    for constraint in constraints.values()
+                ))
+                self.assertEqual([CharTestEnum.SECOND], self.fetch_values(new_state, using))
+
+                new_model = new_state.apps.get_model(APP_LABEL, 'Pony')
+
+                with self.assertRaises(IntegrityError), transaction.atomic(using=using):
+                    new_model.objects.using(using).create(enumeration=CharTestEnum.SECOND, number=1)
+
+                self.apply_operations([operation], state, using=using, backwards=True)
+
+                self.assertIn('pony_enumeration_number', self.get_constraints(using))
+                self.assertEqual([CharTestEnum.SECOND], self.fetch_values(state, using))
+
+
+class AlterEnumChoiceFieldCheckTests(OperationTestCase):
+    def get_check_constraints(self):
+        with connections['postgresql'].cursor() as cursor:
+            cursor.execute(
+                "SELECT conname, convalidated FROM pg_constraint "
+                "WHERE conrelid = 'test_operations_pony'::regclass AND contype = 'c'"
+            )
+
+            return cursor.fetchall()
+
+    def test_check_constraint_is_added_and_validated_on_postgresql(self):
+        state = self.create_model(EnumChoiceField(CharTestEnum), using='postgresql')
+
+        model = state.apps.get_model(APP_LABEL, 'Pony')
+        model.objects.using('postgresql').create(enumeration=CharTestEnum.FIRST)
+
+        operation = AlterEnumChoiceFieldCheck(
+            'Pony',
+            'enumeration',
+            EnumChoiceField(CharTestEnum, db_check_constraint=True)
+        )
+        new_state = self.apply_operations([operation], state, using='postgresql')
+
+        self.assertEqual(
+            [('test_operations_pony_enumeration_enum_check', True)],
+            self.get_check_constraints()
+        )
+        self.assertEqual([CharTestEnum.FIRST], self.fetch_values(new_state, 'postgresql'))
+
+        self.apply_operations([operation], state, using='postgresql', backwards=True)
+
+        self.assertEqual([], self.get_check_constraints())
+
+    def test_check_constraints_from_model_meta_are_kept(self):
+        state = self.create_model(
+            EnumChoiceField(CharTestEnum),
+            using='postgresql',
+            options={
+                'constraints': [
+                    models.CheckConstraint(check=models.Q(enumeration__raw__gt=''), name='pony_enumeration_not_empty')
+                ]
+            }
+        )
+
+        operations = [
+            AlterEnumChoiceFieldCheck(
+                'Pony',
+                'enumeration',
+                EnumChoiceField(CharTestEnum, db_check_constraint=True)
+            ),
+            AlterEnumChoiceFieldCheck(
+                'Pony',
+                'enumeration',
+                EnumChoiceField(CharTestEnum, db_check_constraint=True, legacy_values={'one': CharTestEnum.FIRST})
+            )
+        ]
+        self.apply_operations(operations, state, using='postgresql')
+
+        self.assertEqual(
+            [('pony_enumeration_not_empty', True), ('test_operations_pony_enumeration_enum_check', True)],
+            sorted(self.get_check_constraints())
+        )
+
+        with connections['postgresql'].cursor() as cursor:
+            cursor.execute("INSERT INTO test_operations_pony (enumeration) VALUES ('one')")
+
+            with self.assertRaises(IntegrityError), transaction.atomic(using='postgresql'):
+                cursor.execute("INSERT INTO test_operations_pony (enumeration) VALUES ('')")
+
+    def test_check_constraint_is_added_on_other_backends(self):
+        state = self.create_model(EnumChoiceField(CharTestEnum), using='default')
+
+        operation = AlterEnumChoiceFieldCheck(
+            'Pony',
+            'enumeration',
+            EnumChoiceField(CharTestEnum, db_check_constraint=True)
+        )
+        new_state = self.apply_operations([operation], state, using='default')
+
+        with self.assertRaises(IntegrityError), transaction.atomic(using='default'):
+            with connections['default'].cursor() as cursor:
+                cursor.execute("INSERT INTO test_operations_pony (enumeration) VALUES ('fourth')")
+
+        self.assertEqual([], self.fetch_values(new_state))
+
+
+class PostgresEnumTypeOperationTests(OperationTestCase):
+    def create_enum_type(self, using):
+        operation = CreatePostgresEnumType(
+            'test_enum',
+            build_enum_values(CharTestEnum, value_value)
+        )
+        state = self.apply_operations([operation], ProjectState(), using=using)
+
+        self.addCleanup(
+            self.apply_operations,
+            [DropPostgresEnumType('test_enum', operation.values)],
+            state,
+            using=using
+        )
+
+    def get_enum_values(self):
+        with connections['postgresql'].cursor() as cursor:
+            cursor.execute('SELECT unnest(enum_range(NULL::test_enum))::text')
+
+            return [value for value, in cursor.fetchall()]
+
+    def get_column_type(self, using):
+        with connections[using].cursor() as cursor:
+            description = connections[using].introspection.get_table_description(
+                cursor,
+                'test_operations_pony'
+            )
+
+        column, = [column for column in description if column.name == 'enumeration']
+
+        return column.type_code
+
+    def test_column_uses_enum_type_on_postgresql(self):
+        self.create_enum_type('postgresql')
+        state = self.create_model(
+            EnumChoiceField(CharTestEnum, postgres_enum_type='test_enum'),
+            using='postgresql'
+        )
+
+        with connections['postgresql'].cursor() as cursor:
+            cursor.execute(
+                "SELECT udt_name FROM information_schema.columns "
+                "WHERE table_name = 'test_operations_pony' AND column_name = 'enumeration'"
+            )
+            column_type, = cursor.fetchone()
+
+        self.assertEqual('test_enum', column_type)
+        self.assertEqual(['first', 'second', 'third'], self.get_enum_values())
+
+        model = state.apps.get_model(APP_LABEL, 'Pony')
+        model.objects.using('postgresql').create(enumeration=CharTestEnum.THIRD)
+        model.objects.using('postgresql').create(enumeration=CharTestEnum.FIRST)
+
+        result = model.objects.using('postgresql').order_by('enumeration').values_list('enumeration', flat=True)
+
+        self.assertEqual([CharTestEnum.FIRST, CharTestEnum.THIRD], list(result))
+        self.assertEqual(
+            1,
+            model.objects.using('postgresql').filter(enumeration=CharTestEnum.THIRD).count()
+        )
+        self.assertEqual(
+            [CharTestEnum.FIRST],
+            list(
+                model.objects.using('postgresql').filter(
+                    enumeration__in=[CharTestEnum.FIRST, CharTestEnum.SECOND]
+                ).values_list('enumeration', flat=True)
+            )
+        )
+
+    def test_column_falls_back_to_varchar_on_other_backends(self):
+        self.create_enum_type('default')
+        self.create_model(
+            EnumChoiceField(CharTestEnum, postgres_enum_type='test_enum'),
+            using='default'
+        )
+
+        self.assertEqual('varchar(6)', self.get_column_type('default'))
+
+    def test_add_value(self):
+        self.create_enum_type('postgresql')
+
+        self.apply_operations(
+            [
+                AddPostgresEnumValue('test_enum', 'fourth'),
+                AddPostgresEnumValue('test_enum', 'zero', before='first'),
+                AddPostgresEnumValue('test_enum', 'first_and_a_half', after='first'),
+            ],
+            ProjectState(),
+            using='postgresql'
+        )
+
+        self.assertEqual(
+            ['zero', 'first', 'first_and_a_half', 'second', 'third', 'fourth'],
+            self.get_enum_values()
+        )
+
+    def test_add_value_accepts_only_one_of_before_and_after(self):
+        with self.assertRaises(ValueError):
+            AddPostgresEnumValue('test_enum', 'fourth', before='first', after='first')
+
+    def test_rename_value(self):
+        self.create_enum_type('postgresql')
+        operation = RenamePostgresEnumValue('test_enum', 'first', 'first_updated')
+
+        state = self.apply_operations([operation], ProjectState(), using='postgresql')
+
+        self.assertEqual(['first_updated', 'second', 'third'], self.get_enum_values())
+
+        self.apply_operations([operation], state, using='postgresql', backwards=True)
+
+        self.assertEqual(['first', 'second', 'third'], self.get_enum_values())
+
+
+class RemapEnumValuesTests(OperationTestCase):
+    def insert_values(self, values, using):
+        with connections[using].cursor() as cursor:
+            for value in values:
+                cursor.execute('INSERT INTO test_operations_pony (enumeration) VALUES (%s)', [value])
+
+    def fetch_raw_values(self, using):
+        with connections[using].cursor() as cursor:
+            cursor.execute('SELECT enumeration FROM test_operations_pony ORDER BY id')
+
+            return [value for value, in cursor.fetchall()]
+
+    def test_values_are_remapped_in_chunks(self):
+        for using in ('default', 'postgresql'):
+            with self.subTest(using=using):
+                state = self.create_model(EnumChoiceField(CharTestEnum, null=True), using=using)
+                self.insert_values(['one', 'second', 'one', 'two', None, 'one'], using)
+
+                operation = RemapEnumValues(
+                    'Pony',
+                    'enumeration',
+                    {'one': 'first', 'two': 'third'},
+                    chunk_size=2
+                )
+
+                with self.assertLogs('django_enum_choices.operations', level='INFO') as logs:
+                    self.apply_operations([operation], state, using=using)
+
+                self.assertEqual(
+                    [CharTestEnum.FIRST, CharTestEnum.SECOND, CharTestEnum.FIRST,
+                     CharTestEnum.THIRD, None, CharTestEnum.FIRST],
+                    self.fetch_values(state, using)
+                )
+                self.assertEqual(2, len(logs.records))
+                self.assertIn('Remapped 4 rows of test_operations.Pony.enumeration', logs.output[-1])
+
+    def test_operation_can_be_run_again(self):
+        state = self.create_model(EnumChoiceField(CharTestEnum))
+        self.insert_values(['one', 'second'], 'default')
+
+        operation = RenameEnumValue('Pony', 'enumeration', 'one', 'first', chunk_size=1)
+
+        self.apply_operations([operation], state)
+        self.insert_values(['one'], 'default')
+        self.apply_operations([operation], state)
+
+        self.assertEqual(['first', 'second', 'first'], self.fetch_raw_values('default'))
+
+    def test_operation_is_reversible_when_mapping_is_injective(self):
+        state = self.create_model(EnumChoiceField(CharTestEnum))
+        self.insert_values(['one', 'second'], 'default')
+
+        operation = RenameEnumValue('Pony', 'enumeration', 'one', 'first')
+
+        self.apply_operations([operation], state)
+        self.apply_operations([operation], state, backwards=True)
+
+        self.assertTrue(operation.reversible)
+        self.assertEqual(['one', 'second'], self.fetch_raw_values('default'))
+
+    def test_operation_is_not_reversible_when_values_are_merged_or_removed(self):
+        merging = RemapEnumValues('Pony', 'enumeration', {'one': 'first', 'two': 'first'})
+        removing = RemapEnumValues('Pony', 'enumeration', {'one': None})
+
+        self.assertFalse(merging.reversible)
+        self.assertFalse(removing.reversible)
+
+    def test_codes_are_remapped(self):
+        codes = {CharTestEnum.FIRST: 1, CharTestEnum.SECOND: 2, CharTestEnum.THIRD: 3}
+        state = self.create_model(EnumChoiceField(CharTestEnum, codes=codes))
+        self.insert_values([4, 2], 'default')
+
+        self.apply_operations([RenameEnumValue('Pony', 'enumeration', 4, 3)], state)
+
+        self.assertEqual([CharTestEnum.THIRD, CharTestEnum.SECOND], self.fetch_values(state))
+
+    def test_operation_raises_exception_when_values_are_chained(self):
+        with self.assertRaisesMessage(ValueError, 'Values can not be both remapped and remapped to.'):
+            RemapEnumValues('Pony', 'enumeration', {'one': 'two', 'two': 'three'})
+
+    def test_operation_raises_exception_when_chunk_size_is_not_positive(self):
+        with self.assertRaisesMessage(ValueError, '`chunk_size` must be a positive integer.'):
+            RenameEnumValue('Pony', 'enumeration', 'one', 'first', chunk_size=0)
+
+    def test_deconstruct(self):
+        operation = RenameEnumValue('Pony', 'enumeration', 'one', 'first', chunk_size=10)
+
+        name, args, kwargs = operation.deconstruct()
+
+        self.assertEqual('RenameEnumValue', name)
+        self.assertEqual(['Pony', 'enumeration', 'one', 'first'], list(args))
+        self.assertEqual({'chunk_size': 10}, kwargs)
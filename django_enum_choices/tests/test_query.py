@@ -0,0 +1,255 @@
+from collections import OrderedDict
+
+from django.test import TestCase
+from django.db import connection, connections
+from django.core.exceptions import ValidationError
+from django.test.utils import CaptureQueriesContext
+
+from .testapp.enumerations import CharTestEnum
+from .testapp.models import (
+    NullableEnumeratedModel,
+    IntegerCodesEnumeratedModel,
+    LazyEnumeratedModel,
+    LegacyValuesEnumeratedModel
+)
+
+
+class BulkUpdateEnumTests(TestCase):
+    def create_instances(self, model, count):
+        return [
+            model.objects.create(enumeration=CharTestEnum.FIRST)
+            for _ in range(count)
+        ]
+
+    def fetch_values(self, model):
+        return list(model.objects.order_by('pk').values_list('enumeration', flat=True))
+
+    def test_rows_are_updated(self):
+        first, second, third = self.create_instances(NullableEnumeratedModel, 3)
+
+        updated = NullableEnumeratedModel.objects.bulk_update_enum(
+            'enumeration',
+            {
+                first.pk: CharTestEnum.SECOND,
+                second.pk: CharTestEnum.THIRD,
+                third.pk: CharTestEnum.SECOND
+            }
+        )
+
+        self.assertEqual(3, updated)
+        self.assertEqual(
+            [CharTestEnum.SECOND, CharTestEnum.THIRD, CharTestEnum.SECOND],
+            self.fetch_values(NullableEnumeratedModel)
+        )
+
+    def test_one_update_is_executed_for_every_enumeration(self):
+        instances = self.create_instances(NullableEnumeratedModel, 6)
+
+        values = {
+            instance.pk: [CharTestEnum.SECOND, CharTestEnum.THIRD][index % 2]
+            for index, instance in enumerate(instances)
+        }
+
+        with CaptureQueriesContext(connection) as context:
+            NullableEnumeratedModel.objects.bulk_update_enum('enumeration', values)
+
+        updates = [query['sql'] for query in context.captured_queries if query['sql'].startswith('UPDATE')]
+
+        self.assertEqual(2, len(updates))
+        self.assertTrue(all('CASE' not in update for update in updates))
+
+    def test_updates_are_split_in_batches(self):
+        instances = self.create_instances(NullableEnumeratedModel, 5)
+
+        with CaptureQueriesContext(connection) as context:
+            updated = NullableEnumeratedModel.objects.bulk_update_enum(
+                'enumeration',
+                {instance.pk: CharTestEnum.THIRD for instance in instances},
+                batch_size=2
+            )
+
+        updates = [query['sql'] for query in context.captured_queries if query['sql'].startswith('UPDATE')]
+
+        self.assertEqual(5, updated)
+        self.assertEqual(3, len(updates))
+        self.assertEqual([CharTestEnum.THIRD] * 5, self.fetch_values(NullableEnumeratedModel))
+
+    def test_values_can_be_set_to_none_and_to_choice_values(self):
+        first, second = self.create_instances(NullableEnumeratedModel, 2)
+
+        NullableEnumeratedModel.objects.bulk_update_enum(
+            'enumeration',
+            {first.pk: None, second.pk: 'third'}
+        )
+
+        self.assertEqual([None, CharTestEnum.THIRD], self.fetch_values(NullableEnumeratedModel))
+
+    def test_codes_are_stored(self):
+        instance, = self.create_instances(IntegerCodesEnumeratedModel, 1)
+
+        IntegerCodesEnumeratedModel.objects.bulk_update_enum(
+            'enumeration',
+            {instance.pk: CharTestEnum.THIRD}
+        )
+
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT enumeration FROM testapp_integercodesenumeratedmodel')
+
+            self.assertEqual([(30, )], cursor.fetchall())
+
+    def test_only_the_queryset_rows_are_updated(self):
+        first, second = self.create_instances(NullableEnumeratedModel, 2)
+
+        updated = NullableEnumeratedModel.objects.exclude(pk=second.pk).bulk_update_enum(
+            'enumeration',
+            {first.pk: CharTestEnum.THIRD, second.pk: CharTestEnum.THIRD}
+        )
+
+        self.assertEqual(1, updated)
+        self.assertEqual([CharTestEnum.THIRD, CharTestEnum.FIRST], self.fetch_values(NullableEnumeratedModel))
+
+    def test_raises_exception_when_value_is_not_in_enum_class(self):
+        instance, = self.create_instances(NullableEnumeratedModel, 1)
+
+        with self.assertRaises(ValidationError):
+            NullableEnumeratedModel.objects.bulk_update_enum('enumeration', {instance.pk: 'fourth'})
+
+    def test_raises_exception_when_field_is_not_enum_choice_field(self):
+        with self.assertRaisesMessage(ValueError, 'NullableEnumeratedModel.id is not an EnumChoiceField.'):
+            NullableEnumeratedModel.objects.bulk_update_enum('id', {})
+
+    def test_raises_exception_when_batch_size_is_not_positive(self):
+        with self.assertRaisesMessage(ValueError, 'Batch size must be a positive integer.'):
+            NullableEnumeratedModel.objects.bulk_update_enum('enumeration', {}, batch_size=0)
+
+
+class EnumCountsTests(TestCase):
+    def test_every_enumeration_is_counted(self):
+        for member in (CharTestEnum.FIRST, CharTestEnum.THIRD, CharTestEnum.FIRST):
+            NullableEnumeratedModel.objects.create(enumeration=member)
+
+        with self.assertNumQueries(1):
+            result = NullableEnumeratedModel.objects.enum_counts('enumeration')
+
+        self.assertEqual(
+            OrderedDict([
+                (CharTestEnum.FIRST, 2),
+                (CharTestEnum.SECOND, 0),
+                (CharTestEnum.THIRD, 1)
+            ]),
+            result
+        )
+        self.assertEqual(list(CharTestEnum), list(result))
+
+    def test_rows_without_a_value_are_counted_under_none(self):
+        NullableEnumeratedModel.objects.create(enumeration=CharTestEnum.SECOND)
+        NullableEnumeratedModel.objects.create(enumeration=None)
+
+        result = NullableEnumeratedModel.objects.enum_counts('enumeration')
+
+        self.assertEqual(1, result[None])
+        self.assertEqual([CharTestEnum.FIRST, CharTestEnum.SECOND, CharTestEnum.THIRD, None], list(result))
+
+    def test_filtered_queryset_is_counted(self):
+        NullableEnumeratedModel.objects.create(enumeration=CharTestEnum.FIRST)
+        second = NullableEnumeratedModel.objects.create(enumeration=CharTestEnum.SECOND)
+
+        result = NullableEnumeratedModel.objects.order_by('-pk').exclude(pk=second.pk).enum_counts('enumeration')
+
+        self.assertEqual([1, 0, 0], list(result.values()))
+        self.assertNotIn(None, result)
+
+    def test_codes_are_decoded(self):
+        IntegerCodesEnumeratedModel.objects.create(enumeration=CharTestEnum.THIRD)
+
+        result = IntegerCodesEnumeratedModel.objects.enum_counts('enumeration')
+
+        self.assertEqual(1, result[CharTestEnum.THIRD])
+        self.assertEqual(0, result[CharTestEnum.FIRST])
+
+    def test_lazy_field_values_are_decoded(self):
+        LazyEnumeratedModel.objects.create(enumeration=CharTestEnum.FIRST)
+        LazyEnumeratedModel.objects.create(enumeration=None)
+
+        result = LazyEnumeratedModel.objects.enum_counts('enumeration')
+
+        self.assertEqual(
+            OrderedDict([
+                (CharTestEnum.FIRST, 1),
+                (CharTestEnum.SECOND, 0),
+                (CharTestEnum.THIRD, 0),
+                (None, 1)
+            ]),
+            result
+        )
+
+    def test_legacy_values_are_counted_with_their_enumeration(self):
+        with connections['default'].cursor() as cursor:
+            for value in ('first', 'one', 'one', 'old_third'):
+                cursor.execute(
+                    'INSERT INTO testapp_legacyvaluesenumeratedmodel (enumeration) VALUES (%s)',
+                    [value]
+                )
+
+        result = LegacyValuesEnumeratedModel.objects.enum_counts('enumeration')
+
+        self.assertEqual(
+            OrderedDict([
+                (CharTestEnum.FIRST, 3),
+                (CharTestEnum.SECOND, 0),
+                (CharTestEnum.THIRD, 1)
+            ]),
+            result
+        )
+        self.assertEqual(3, LegacyValuesEnumeratedModel.objects.filter(enumeration=CharTestEnum.FIRST).count())
+
+
+class RawEnumValuesTests(TestCase):
+    databases = ['default', 'postgresql']
+
+    def test_raw_transform_selects_stored_values(self):
+        for using in ('default', 'postgresql'):
+            with self.subTest(using=using):
+                NullableEnumeratedModel.objects.using(using).create(enumeration=CharTestEnum.SECOND)
+                NullableEnumeratedModel.objects.using(using).create(enumeration=None)
+
+                result = NullableEnumeratedModel.objects.using(using).order_by('pk').values_list(
+                    'enumeration__raw',
+                    flat=True
+                )
+
+                self.assertEqual(['second', None], list(result))
+
+    def test_raw_transform_selects_codes(self):
+        IntegerCodesEnumeratedModel.objects.create(enumeration=CharTestEnum.SECOND)
+
+        result = IntegerCodesEnumeratedModel.objects.values_list('enumeration__raw', flat=True)
+
+        self.assertEqual([20], list(result))
+
+    def test_raw_transform_can_be_filtered(self):
+        instance = NullableEnumeratedModel.objects.create(enumeration=CharTestEnum.THIRD)
+
+        result = NullableEnumeratedModel.objects.filter(enumeration__raw='third')
+
+        self.assertEqual([instance], list(result))
+
+    def test_values_list_returns_stored_values_with_raw_enums(self):
+        instance = NullableEnumeratedModel.objects.create(enumeration=CharTestEnum.FIRST)
+
+        self.assertEqual(
+            [(instance.pk, 'first')],
+            list(NullableEnumeratedModel.objects.values_list('pk', 'enumeration', raw_enums=True))
+        )
+        self.assertEqual(
+            [(instance.pk, 'first')],
+            list(NullableEnumeratedModel.objects.values_list(raw_enums=True))
+        )
+        self.assertEqual(
+            ['first'],
+            list(NullableEnumeratedModel.objects.values_list('enumeration', flat=True, raw_enums=True))
+        )
+        self.assertEqual(
+            [CharTestEnum.FIRST],
+            list(NullableEnumeratedModel.objects.values_list('enumeration', flat=True))
+        )
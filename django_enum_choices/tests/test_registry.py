@@ -0,0 +1,88 @@
+from django.test import TestCase
+
+from django_enum_choices.registry import get_enum_choice_map
+from django_enum_choices.choice_builders import value_value, attribute_value
+from django_enum_choices.utils import as_choice_builder
+from django_enum_choices.fields import EnumChoiceField
+from django_enum_choices.forms import EnumChoiceField as EnumChoiceFormField
+from django_enum_choices.serializers import EnumChoiceField as EnumChoiceSerializerField
+
+from .testapp.enumerations import CharTestEnum, IntTestEnum
+
+
+class EnumChoiceMapTests(TestCase):
+    def test_map_contains_built_choices(self):
+        choice_map = get_enum_choice_map(CharTestEnum, attribute_value)
+
+        self.assertEqual(
+            (('FIRST', 'first'), ('SECOND', 'second'), ('THIRD', 'third')),
+            choice_map.choices
+        )
+
+    def test_map_resolves_members_from_built_values(self):
+        choice_map = get_enum_choice_map(IntTestEnum, value_value)
+
+        self.assertEqual(IntTestEnum.FIRST, choice_map.get_member('1'))
+        self.assertEqual('1', choice_map.value_by_member[IntTestEnum.FIRST])
+        self.assertEqual('1', choice_map.label_by_member[IntTestEnum.FIRST])
+
+    def test_get_member_returns_none_when_value_is_not_found(self):
+        choice_map = get_enum_choice_map(CharTestEnum, value_value)
+
+        self.assertIsNone(choice_map.get_member('foo'))
+        self.assertIsNone(choice_map.get_member(['first']))
+
+    def test_map_resolves_first_member_when_members_build_the_same_value(self):
+        def same_value(choice):
+            return 'same', choice.value
+
+        choice_map = get_enum_choice_map(CharTestEnum, same_value)
+
+        self.assertEqual(CharTestEnum.FIRST, choice_map.get_member('same'))
+        self.assertEqual(
+            CharTestEnum.FIRST,
+            EnumChoiceField(CharTestEnum, choice_builder=same_value).to_python('same')
+        )
+
+    def test_map_is_shared_for_the_same_enum_class_and_choice_builder(self):
+        first = get_enum_choice_map(CharTestEnum, value_value)
+        second = get_enum_choice_map(CharTestEnum, as_choice_builder(value_value))
+
+        self.assertIs(first, second)
+
+    def test_map_is_not_shared_between_different_choice_builders(self):
+        first = get_enum_choice_map(CharTestEnum, value_value)
+        second = get_enum_choice_map(CharTestEnum, attribute_value)
+
+        self.assertIsNot(first, second)
+
+    def test_model_form_and_serializer_fields_share_the_map(self):
+        model_field = EnumChoiceField(enum_class=CharTestEnum)
+        form_field = model_field.formfield()
+        serializer_field = EnumChoiceSerializerField(enum_class=CharTestEnum)
+        standalone_form_field = EnumChoiceFormField(CharTestEnum)
+
+        self.assertIs(model_field.choice_map, form_field.choice_map)
+        self.assertIs(model_field.choice_map, serializer_field.choice_map)
+        self.assertIs(model_field.choice_map, standalone_form_field.choice_map)
+
+    def test_map_contains_max_length_of_built_values(self):
+        choice_map = get_enum_choice_map(CharTestEnum, attribute_value)
+
+        self.assertEqual(6, choice_map.max_length)
+
+    def test_choices_are_built_once_for_repeated_field_construction(self):
+        calls = []
+
+        def choice_builder(enumeration):
+            calls.append(enumeration)
+
+            return enumeration.value, enumeration.value
+
+        first = EnumChoiceField(enum_class=CharTestEnum, choice_builder=choice_builder)
+        second = EnumChoiceField(enum_class=CharTestEnum, choice_builder=choice_builder)
+
+        self.assertEqual(3, len(calls))
+        self.assertEqual(first.choices, second.choices)
+        self.assertIsNot(first.choices, second.choices)
+        self.assertEqual(6, second.max_length)
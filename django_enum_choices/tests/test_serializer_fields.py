@@ -1,8 +1,13 @@
+import copy
+from unittest import mock
+
+from django.http import QueryDict
 from django.test import TestCase
 
+from rest_framework import serializers
 from rest_framework.exceptions import ValidationError
 
-from django_enum_choices.serializers import EnumChoiceField, MultipleEnumChoiceField
+from django_enum_choices.serializers import EnumChoiceField, MultipleEnumChoiceField, EnumSetField
 from .testapp.enumerations import IntTestEnum, CharTestEnum
 
 
@@ -45,6 +50,27 @@ class TestSerializerField(TestCase):
 
         self.assertEqual(result, CharTestEnum.FIRST)
 
+    def test_to_internal_value_fails_when_value_is_not_hashable(self):
+        field = EnumChoiceField(enum_class=CharTestEnum)
+
+        with self.assertRaisesMessage(
+            ValidationError,
+            "Key ['first'] is not a valid CharTestEnum"
+        ):
+            field.to_internal_value(['first'])
+
+    def test_copied_fields_share_the_decode_table(self):
+        class EnumSerializer(serializers.Serializer):
+            enumeration = EnumChoiceField(enum_class=CharTestEnum)
+
+        field = EnumSerializer().fields['enumeration']
+        other_field = EnumSerializer().fields['enumeration']
+
+        self.assertIsNot(field, other_field)
+        self.assertIs(field.choice_map, other_field.choice_map)
+        self.assertIs(field.choice_map, copy.deepcopy(field).choice_map)
+        self.assertEqual(CharTestEnum.SECOND, other_field.to_internal_value('second'))
+
 
 class TestMultipleSerializerField(TestCase):
     def test_to_representation_returns_list_of_ints(self):
@@ -92,3 +118,91 @@ class TestMultipleSerializerField(TestCase):
         result = field.to_internal_value(['first', 'second'])
 
         self.assertEqual([CharTestEnum.FIRST, CharTestEnum.SECOND], result)
+
+    def test_to_internal_value_returns_frozenset_when_as_set(self):
+        field = MultipleEnumChoiceField(enum_class=CharTestEnum, as_set=True)
+
+        result = field.to_internal_value(['first', 'second', 'first'])
+
+        self.assertEqual(frozenset([CharTestEnum.FIRST, CharTestEnum.SECOND]), result)
+
+    def test_to_internal_value_removes_duplicates_in_order_when_unique(self):
+        field = MultipleEnumChoiceField(enum_class=CharTestEnum, unique=True)
+
+        result = field.to_internal_value(['second', 'first', 'second', 'third', 'first'])
+
+        self.assertEqual([CharTestEnum.SECOND, CharTestEnum.FIRST, CharTestEnum.THIRD], result)
+
+    def test_to_internal_value_fails_when_list_is_longer_than_max_length(self):
+        field = MultipleEnumChoiceField(enum_class=CharTestEnum, max_length=2)
+
+        with mock.patch.object(
+            EnumChoiceField,
+            'to_internal_value',
+            autospec=True
+        ) as to_internal_value:
+            with self.assertRaisesMessage(
+                ValidationError,
+                'Ensure this field has no more than 2 elements.'
+            ):
+                field.to_internal_value(['first', 'second', 'third'])
+
+        to_internal_value.assert_not_called()
+
+    def test_to_internal_value_fails_when_list_is_shorter_than_min_length(self):
+        field = MultipleEnumChoiceField(enum_class=CharTestEnum, min_length=2)
+
+        with self.assertRaisesMessage(
+            ValidationError,
+            'Ensure this field has at least 2 elements.'
+        ):
+            field.to_internal_value(['first'])
+
+    def test_to_internal_value_accepts_lists_within_length_limits(self):
+        field = MultipleEnumChoiceField(enum_class=CharTestEnum, min_length=1, max_length=2)
+
+        result = field.to_internal_value(['first', 'third'])
+
+        self.assertEqual([CharTestEnum.FIRST, CharTestEnum.THIRD], result)
+
+    def test_to_internal_value_splits_delimited_values(self):
+        field = MultipleEnumChoiceField(enum_class=CharTestEnum, delimiter=',')
+
+        self.assertEqual([CharTestEnum.FIRST, CharTestEnum.THIRD], field.to_internal_value('first,third'))
+        self.assertEqual(
+            [CharTestEnum.FIRST, CharTestEnum.SECOND, CharTestEnum.THIRD],
+            field.to_internal_value(['first', 'second, third'])
+        )
+
+    def test_to_internal_value_fails_when_value_is_string_and_there_is_no_delimiter(self):
+        field = MultipleEnumChoiceField(enum_class=CharTestEnum)
+
+        with self.assertRaisesMessage(
+            ValidationError,
+            'Expected a list of items but got type "str".'
+        ):
+            field.to_internal_value('first,third')
+
+    def test_get_value_returns_all_values_of_repeated_query_parameters(self):
+        field = MultipleEnumChoiceField(enum_class=CharTestEnum)
+        field.bind('enumeration', serializers.Serializer())
+
+        result = field.get_value(QueryDict('enumeration=first&enumeration=second'))
+
+        self.assertEqual(['first', 'second'], result)
+
+
+class TestEnumSetSerializerField(TestCase):
+    def test_to_representation_returns_values_in_enum_class_order(self):
+        field = EnumSetField(enum_class=CharTestEnum)
+
+        result = field.to_representation(frozenset([CharTestEnum.THIRD, CharTestEnum.FIRST]))
+
+        self.assertEqual(['first', 'third'], result)
+
+    def test_to_internal_value_returns_frozenset(self):
+        field = EnumSetField(enum_class=CharTestEnum)
+
+        result = field.to_internal_value(['first', 'third', 'first'])
+
+        self.assertEqual(frozenset([CharTestEnum.FIRST, CharTestEnum.THIRD]), result)
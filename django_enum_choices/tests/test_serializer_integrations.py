@@ -1,17 +1,24 @@
+from unittest import mock
+
 from django.test import TestCase
 
 from rest_framework import serializers
 
+from django_enum_choices.fields import EnumChoiceField as ModelEnumChoiceField
 from django_enum_choices.serializers import (
     EnumChoiceField,
     EnumChoiceModelSerializerMixin,
-    MultipleEnumChoiceField
+    MultipleEnumChoiceField,
+    EnumSetField,
+    EnumChoiceListSerializer
 )
 from .testapp.models import (
     StringEnumeratedModel,
     MultipleEnumeratedModel,
     CustomChoiceBuilderEnumeratedModel,
-    BlankNullableEnumeratedModel
+    BlankNullableEnumeratedModel,
+    NullableEnumeratedModel,
+    EnumSetModel
 )
 from .testapp.enumerations import CharTestEnum
 
@@ -430,3 +437,146 @@ class MultipleEnumChoiceFieldModelSerializerIntegrationTests(TestCase):
             [CharTestEnum.FIRST, CharTestEnum.SECOND, CharTestEnum.THIRD],
             instance.enumeration
         )
+
+
+class EnumSetFieldModelSerializerIntegrationTests(TestCase):
+    class Serializer(EnumChoiceModelSerializerMixin, serializers.ModelSerializer):
+        class Meta:
+            model = EnumSetModel
+            fields = ('enumeration', )
+
+    def test_field_is_built_as_enum_set_field(self):
+        field = self.Serializer().fields['enumeration']
+
+        self.assertIsInstance(field, EnumSetField)
+        self.assertTrue(field.allow_empty)
+
+    def test_field_is_serialized_correctly(self):
+        instance = EnumSetModel.objects.create(
+            enumeration={CharTestEnum.SECOND, CharTestEnum.FIRST}
+        )
+
+        result = self.Serializer(instance).data['enumeration']
+
+        self.assertEqual(['first', 'second'], result)
+
+    def test_instance_is_created_successfully(self):
+        serializer = self.Serializer(data={'enumeration': ['third']})
+
+        self.assertTrue(serializer.is_valid())
+
+        instance = serializer.save()
+        instance.refresh_from_db()
+
+        self.assertEqual(frozenset([CharTestEnum.THIRD]), instance.enumeration)
+
+
+class EnumChoiceListSerializerIntegrationTests(TestCase):
+    class Serializer(EnumChoiceModelSerializerMixin, serializers.ModelSerializer):
+        enumerations = MultipleEnumChoiceField(enum_class=CharTestEnum, source='get_enumerations')
+
+        class Meta:
+            model = NullableEnumeratedModel
+            fields = ('id', 'enumeration', 'enumerations')
+            list_serializer_class = EnumChoiceListSerializer
+
+    def setUp(self):
+        NullableEnumeratedModel.get_enumerations = lambda instance: [
+            member for member in CharTestEnum if member != instance.enumeration
+        ]
+        self.addCleanup(delattr, NullableEnumeratedModel, 'get_enumerations')
+
+        self.instances = [
+            NullableEnumeratedModel.objects.create(enumeration=member)
+            for member in (CharTestEnum.FIRST, None, CharTestEnum.THIRD)
+        ]
+
+    def test_many_serializer_returns_same_data_as_child_serializer(self):
+        queryset = NullableEnumeratedModel.objects.order_by('pk')
+
+        result = self.Serializer(queryset, many=True).data
+
+        self.assertEqual(
+            [self.Serializer(instance).data for instance in self.instances],
+            result
+        )
+
+    def test_enum_fields_are_encoded_a_column_at_a_time(self):
+        queryset = NullableEnumeratedModel.objects.order_by('pk')
+
+        with mock.patch.object(
+            EnumChoiceField,
+            'to_representation_column',
+            autospec=True,
+            side_effect=EnumChoiceField.to_representation_column
+        ) as to_representation_column:
+            result = self.Serializer(queryset, many=True).data
+
+        self.assertEqual(1, to_representation_column.call_count)
+        self.assertEqual(['first', None, 'third'], [row['enumeration'] for row in result])
+        self.assertEqual(['second', 'third'], result[0]['enumerations'])
+
+
+class EnumChoiceModelSerializerMixinFieldCacheTests(TestCase):
+    def build_serializer_class(self):
+        class Serializer(EnumChoiceModelSerializerMixin, serializers.ModelSerializer):
+            class Meta:
+                model = StringEnumeratedModel
+                fields = ('enumeration', )
+                extra_kwargs = {'enumeration': {'required': False}}
+
+        return Serializer
+
+    def test_field_mapping_is_registered_on_the_serializer_class_only(self):
+        Serializer = self.build_serializer_class()
+
+        Serializer()
+
+        self.assertIs(EnumChoiceField, Serializer.serializer_field_mapping[ModelEnumChoiceField])
+        self.assertNotIn(ModelEnumChoiceField, serializers.ModelSerializer.serializer_field_mapping)
+
+    def test_field_mapping_is_not_replaced_on_every_instantiation(self):
+        Serializer = self.build_serializer_class()
+
+        Serializer()
+        mapping = Serializer.serializer_field_mapping
+        Serializer()
+
+        self.assertIs(mapping, Serializer.serializer_field_mapping)
+
+    def test_enum_field_kwargs_are_built_once_per_serializer_class(self):
+        Serializer = self.build_serializer_class()
+
+        with mock.patch.object(
+            EnumChoiceModelSerializerMixin,
+            '_build_enum_field_kwargs',
+            autospec=True,
+            side_effect=EnumChoiceModelSerializerMixin._build_enum_field_kwargs
+        ) as build_enum_field_kwargs:
+            first = Serializer().fields['enumeration']
+            second = Serializer().fields['enumeration']
+
+        self.assertEqual(1, build_enum_field_kwargs.call_count)
+        self.assertFalse(first.required)
+        self.assertFalse(second.required)
+
+    def test_cached_kwargs_are_not_changed_by_extra_kwargs(self):
+        Serializer = self.build_serializer_class()
+
+        Serializer().fields
+
+        for field_class, kwargs in Serializer._enum_choice_field_cache.values():
+            self.assertNotIn('required', kwargs)
+
+    def test_serializer_subclasses_have_their_own_cache(self):
+        Serializer = self.build_serializer_class()
+
+        class SubclassSerializer(Serializer):
+            class Meta(Serializer.Meta):
+                model = NullableEnumeratedModel
+
+        Serializer().fields
+        field = SubclassSerializer().fields['enumeration']
+
+        self.assertTrue(field.allow_null)
+        self.assertIsNot(Serializer._enum_choice_field_cache, SubclassSerializer._enum_choice_field_cache)
@@ -46,9 +46,11 @@ class DataBaseRouter:
         return None
 
     def allow_migrate(self, db, app_label, model_name=None, **hints):
-        if model_name is not None and \
-           db == DEFAULT and \
-           self.has_postgres_field(apps.get_model(app_label, model_name)):
-            return False
+        if model_name is not None and db == DEFAULT:
+            # Models from migration states are passed as a hint
+            model = hints.get('model') or apps.get_model(app_label, model_name)
+
+            if self.has_postgres_field(model):
+                return False
 
         return True
@@ -1,8 +1,10 @@
 from django.db import models
 from django.contrib.postgres.fields import ArrayField
 
-from django_enum_choices.fields import EnumChoiceField
+from django_enum_choices.fields import EnumChoiceField, EnumSetField
 from django_enum_choices.choice_builders import attribute_value
+from django_enum_choices.code_builders import value_code
+from django_enum_choices.query import EnumChoiceManager
 
 from .enumerations import CharTestEnum, CharLongValuesTestEnum, IntTestEnum
 
@@ -25,6 +27,8 @@ class NullableEnumeratedModel(models.Model):
         null=True
     )
 
+    objects = EnumChoiceManager()
+
 
 class BlankNullableEnumeratedModel(models.Model):
     enumeration = EnumChoiceField(
@@ -62,3 +66,69 @@ class AttributeChoiceBuilderEnumeratedModel(models.Model):
         enum_class=CharLongValuesTestEnum,
         choice_builder=attribute_value
     )
+
+
+class IntegerCodesEnumeratedModel(models.Model):
+    enumeration = EnumChoiceField(
+        enum_class=CharTestEnum,
+        codes={
+            CharTestEnum.FIRST: 10,
+            CharTestEnum.SECOND: 20,
+            CharTestEnum.THIRD: 30
+        }
+    )
+
+    objects = EnumChoiceManager()
+
+
+class ValueCodeEnumeratedModel(models.Model):
+    enumeration = EnumChoiceField(
+        enum_class=IntTestEnum,
+        codes=value_code,
+        null=True
+    )
+
+
+class CheckConstraintEnumeratedModel(models.Model):
+    enumeration = EnumChoiceField(
+        enum_class=CharTestEnum,
+        db_check_constraint=True
+    )
+
+
+class LazyEnumeratedModel(models.Model):
+    enumeration = EnumChoiceField(
+        enum_class=CharTestEnum,
+        lazy=True,
+        null=True
+    )
+
+    objects = EnumChoiceManager()
+
+
+class CustomDisplayEnumeratedModel(models.Model):
+    enumeration = EnumChoiceField(enum_class=CharTestEnum)
+
+    def get_enumeration_display(self):
+        return 'Custom {}'.format(self.enumeration.value)
+
+
+class LegacyValuesEnumeratedModel(models.Model):
+    enumeration = EnumChoiceField(
+        enum_class=CharTestEnum,
+        legacy_values={
+            'one': CharTestEnum.FIRST,
+            'old_third': CharTestEnum.THIRD
+        },
+        db_check_constraint=True
+    )
+
+    objects = EnumChoiceManager()
+
+
+class EnumSetModel(models.Model):
+    enumeration = EnumSetField(
+        enum_class=CharTestEnum,
+        default=frozenset,
+        blank=True
+    )
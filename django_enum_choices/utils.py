@@ -1,4 +1,4 @@
-from typing import Callable, Tuple, Any
+from typing import Callable, List, Tuple, Any
 from enum import Enum
 
 from django.utils.translation import gettext as _
@@ -7,6 +7,10 @@ from .exceptions import EnumChoiceFieldException
 
 
 def as_choice_builder(choice_builder):
+    if hasattr(choice_builder, '_original_choice_builder'):
+        # Already wrapped
+        return choice_builder
+
     def inner(enumeration):
         if not enumeration:
             return enumeration
@@ -15,6 +19,9 @@ def as_choice_builder(choice_builder):
 
         return tuple(str(value) for value in built)
 
+    # Saving original so wrappers of the same choice builder can be matched
+    inner._original_choice_builder = choice_builder
+
     return inner
 
 
@@ -25,6 +32,27 @@ def value_from_built_choice(built_choice):
     return built_choice
 
 
+def split_delimited_values(values, delimiter):
+    """
+    Splits every string in `values` by `delimiter`, I.E: `['a,b', 'c']` -> `['a', 'b', 'c']`.
+    Surrounding whitespace is stripped and the empty values are dropped.
+    """
+
+    split_values = []
+
+    for value in values:
+        if not isinstance(value, str):
+            split_values.append(value)
+            continue
+
+        split_values.extend(
+            item.strip() for item in value.split(delimiter)
+            if item.strip()
+        )
+
+    return split_values
+
+
 def validate_built_choices(
     enum_class: Enum,
     built_choices: Tuple[Tuple[Any]]
@@ -76,3 +104,13 @@ def build_enum_choices(
     validate_built_choices(enum_class, choices)
 
     return choices
+
+
+def build_enum_values(
+    enum_class: Enum,
+    choice_builder: Callable
+) -> List[str]:
+    return [
+        value_from_built_choice(choice)
+        for choice in build_enum_choices(enum_class, as_choice_builder(choice_builder))
+    ]